@@ -10,15 +10,24 @@ Contains all AI agent definitions for the content generation workflow.
 __version__ = "1.0.0"
 __author__ = "Blog Brain Team"
 
+from utils.logger import setup_logger
+
+# Shared by every agent module (set before the submodule imports below);
+# settings are resolved per call with get_settings()
+logger = setup_logger(__name__)
+
 # Import all agent creation functions
 from agents.researcher import create_research_agent
 from agents.strategist import create_seo_strategist
 from agents.writer import create_writer_agent
 from agents.editor import create_editor_agent
+from agents.bootstrap import warmup, acreate_all_agents
 
 __all__ = [
     'create_research_agent',
     'create_seo_strategist',
     'create_writer_agent',
-    'create_editor_agent'
+    'create_editor_agent',
+    'warmup',
+    'acreate_all_agents'
 ]
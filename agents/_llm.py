@@ -0,0 +1,98 @@
+"""
+Shared LLM configuration for Blog Brain agents.
+
+Agents talk to Gemini through CrewAI's native LLM class, which routes
+"gemini/*" models to its Gemini provider. CrewAI rebuilds any foreign LLM
+object from its model name and temperature, so everything the agents rely
+on (streaming, thinking budget) is set here on the crewai.LLM itself.
+All of them send requests through one Gemini client and are rate limited
+by one RPMController shared by every agent.
+"""
+
+from functools import lru_cache
+from typing import Optional
+from crewai import LLM
+from crewai.utilities.rpm_controller import RPMController
+from google import genai
+from google.genai import types
+from config import get_settings
+
+
+@lru_cache(maxsize=1)
+def get_rpm_controller() -> Optional[RPMController]:
+    """
+    Get the process-wide Gemini request limiter.
+
+    Every agent is given this one controller, so settings.rpm_limit caps
+    all agents, crews and concurrent runs in the process together.
+    Crew(max_rpm=...) would give each crew its own budget instead.
+
+    Returns:
+        RPMController for settings.rpm_limit, or None when it is 0
+    """
+    rpm_limit = get_settings().rpm_limit
+    if rpm_limit <= 0:
+        return None
+    return RPMController(max_rpm=rpm_limit)
+
+
+@lru_cache(maxsize=1)
+def get_gemini_client() -> genai.Client:
+    """
+    Get the process-wide Gemini API client.
+
+    The client owns the HTTP connection pool. Sharing it means every
+    agent reuses the same warm connections instead of one pool per LLM.
+
+    Returns:
+        genai.Client for the Gemini API, authenticated with settings.gemini_api_key
+    """
+    return genai.Client(api_key=get_settings().gemini_api_key, vertexai=False)
+
+
+@lru_cache(maxsize=None)
+def create_llm(
+    temperature: float,
+    thinking_budget: Optional[int] = None,
+    model: Optional[str] = None
+) -> LLM:
+    """
+    Create the Gemini LLM for an agent.
+
+    LLMs are cached per argument set and all share get_gemini_client().
+    Agents are not cached: CrewAI binds each agent to its crew and
+    executor, so every crew builds its own agents around these shared LLMs.
+
+    Args:
+        temperature: Sampling temperature for this agent
+        thinking_budget: Max Gemini thinking tokens (0 disables, -1 is dynamic,
+                         None keeps the model default)
+        model: Gemini model override (None uses settings.gemini_model)
+
+    Returns:
+        crewai.LLM shared by every agent created with the same arguments
+
+    Example:
+        >>> settings = get_settings()
+        >>> llm = create_llm(settings.writer_temperature, settings.writer_thinking_budget)
+    """
+    settings = get_settings()
+
+    # The Gemini provider only reads thinking_config (it ignores extra
+    # keyword arguments)
+    extra_params = {}
+    if thinking_budget is not None:
+        extra_params["thinking_config"] = types.ThinkingConfig(thinking_budget=thinking_budget)
+
+    llm = LLM(
+        model=f"gemini/{model or settings.gemini_model}",
+        api_key=settings.gemini_api_key,
+        temperature=temperature,
+        stream=settings.enable_llm_streaming,
+        **extra_params
+    )
+
+    # The provider builds a client per instance and has no option to pass
+    # one in, so swap in the shared client
+    llm._client = get_gemini_client()
+    return llm
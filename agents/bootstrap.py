@@ -0,0 +1,61 @@
+"""
+Agent Bootstrap - Process Warmup
+
+Builds all four agents concurrently so the first content generation
+request doesn't pay the import and LLM client setup cost.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from crewai import Agent
+from agents.researcher import create_research_agent
+from agents.strategist import create_seo_strategist
+from agents.writer import create_writer_agent
+from agents.editor import create_editor_agent
+from agents import logger
+
+AGENT_FACTORIES = {
+    "researcher": create_research_agent,
+    "strategist": create_seo_strategist,
+    "writer": create_writer_agent,
+    "editor": create_editor_agent,
+}
+
+
+def warmup() -> Dict[str, Agent]:
+    """
+    Construct all agents in parallel and populate the LLM client cache.
+
+    Agents are built per crew, so the instances returned here are not
+    reused by the task builders; the shared LLM clients they create are.
+
+    Returns:
+        Dictionary mapping agent name to its Agent instance
+    """
+    with ThreadPoolExecutor(max_workers=len(AGENT_FACTORIES)) as executor:
+        agents = dict(zip(
+            AGENT_FACTORIES,
+            executor.map(lambda factory: factory(), AGENT_FACTORIES.values())
+        ))
+
+    logger.info(f"Warmed up {len(agents)} agents")
+    return agents
+
+
+async def acreate_all_agents() -> Dict[str, Agent]:
+    """
+    Async variant of warmup() for use inside a running event loop.
+
+    Factories run in worker threads, so other startup coroutines can
+    proceed while the agents are being built.
+
+    Returns:
+        Dictionary mapping agent name to its Agent instance
+    """
+    agents = await asyncio.gather(
+        *(asyncio.to_thread(factory) for factory in AGENT_FACTORIES.values())
+    )
+
+    logger.info(f"Warmed up {len(agents)} agents")
+    return dict(zip(AGENT_FACTORIES, agents))
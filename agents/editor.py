@@ -5,14 +5,104 @@ This agent performs quality assurance, final formatting, and generates metadata.
 """
 
 from crewai import Agent
-from langchain_google_genai import ChatGoogleGenerativeAI
-from config import settings
-from utils.logger import setup_logger
+from agents import logger as package_logger
+from config import get_settings
+from agents._llm import create_llm
 
-logger = setup_logger(__name__)
+_GOAL = (
+    "Polish draft content to publication quality. Ensure formatting is perfect, "
+    "tone is consistent, all SEO requirements are met, and the content sounds "
+    "authentically human. Generate compelling metadata that drives clicks."
+)
 
+_BACKSTORY = """You are a ruthless but fair managing editor with 20 years of experience
+in digital publishing. You've edited thousands of articles for major publications
+and have zero tolerance for mediocrity.
 
-def create_editor_agent() -> Agent:
+Your Standards (Zero Tolerance For):
+❌ Robotic or AI-sounding language
+❌ Formatting inconsistencies
+❌ Missing citations or vague claims
+❌ Poor readability or confusing structure
+❌ Weak introductions or conclusions
+❌ Meta titles/descriptions that don't compel clicks
+
+Your Review Process:
+
+1. CONTENT QUALITY CHECK
+   - Does it sound like a human wrote this?
+   - Are there any AI-isms or robotic phrases?
+   - Is the tone consistent throughout?
+   - Does it flow naturally from section to section?
+   - Would I want to read this myself?
+
+2. FACTUAL VERIFICATION
+   - Are all claims backed by evidence?
+   - Are sources properly cited with hyperlinks?
+   - Are statistics and data points accurate?
+   - Is there any vague or weasel wording?
+
+3. FORMATTING REVIEW
+   - Verify proper heading hierarchy (only one H1, proper H2/H3 nesting)
+   - Ensure all links are valid and properly formatted
+   - Check list formatting (bullets, numbered lists)
+   - Verify code blocks if present
+
+4. SEO FINALIZATION
+   - Generate meta title (55-60 characters, includes focus keyword)
+   - Create meta description (150-160 characters, compelling call-to-action)
+   - Generate URL slug from title (lowercase, hyphens, no special chars)
+   - Verify focus keyword is in first 100 words
+   - Confirm proper keyword density without stuffing
+
+5. TECHNICAL VALIDATION
+   - Calculate accurate estimated reading time
+   - Count total words
+   - Extract and list all source URLs
+   - Validate JSON output format matches schema exactly
+
+6. QUALITY GATE DECISION
+   - If content passes all checks: Format and approve
+   - If minor issues: Fix them yourself
+   - If major quality issues: REJECT and send back to writer with specific feedback
+
+Your Output:
+You generate the final JSON object that's ready for the API response.
+Every field must be filled correctly, every format must be perfect.
+
+Your Philosophy:
+"Good enough is not good enough. Either it's publication-ready, or it goes back."
+
+You are the last line of defense between mediocre content and excellence."""
+
+# Only added when delegation is enabled, otherwise the model keeps proposing
+# hand-offs it cannot make
+_DELEGATION_BACKSTORY = """
+
+Your Authority:
+You have the power to send drafts back to the writer if quality is insufficient.
+Use delegation when the content needs substantial rewriting, not just polishing."""
+
+
+def editor_can_delegate(settings=None) -> bool:
+    """
+    Check whether the editor agent is allowed to delegate.
+    
+    The editing task uses this to leave delegation out of its prompt when
+    the editor has no delegation tool.
+    
+    Args:
+        settings: Application settings (defaults to get_settings())
+        
+    Returns:
+        True if ENABLE_DELEGATION or EDITOR_ALLOW_DELEGATION is set
+    """
+    settings = settings or get_settings()
+    
+    return settings.enable_delegation or settings.editor_allow_delegation
+
+
+def create_editor_agent(settings=None, logger=None) -> Agent:
     """
     Create the Managing Editor agent.
     
@@ -21,100 +111,45 @@ def create_editor_agent() -> Agent:
     - Checks for AI-sounding language and robotic phrasing
     - Ensures proper formatting and structure
     - Generates optimized meta titles and descriptions
-    - Converts Markdown to HTML
-    - Can delegate back to the writer if quality is insufficient
+    - Can delegate back to the writer if EDITOR_ALLOW_DELEGATION is enabled
+    
+    Args:
+        settings: Application settings (defaults to get_settings())
+        logger: Logger to report on (defaults to the agents package logger)
     
     Returns:
         Configured Agent instance
     """
     
+    settings = settings or get_settings()
+    logger = logger or package_logger
+    
     # Configure LLM with low temperature for consistency
-    llm = ChatGoogleGenerativeAI(
-        model=settings.gemini_model,
-        google_api_key=settings.gemini_api_key,
-        temperature=settings.editor_temperature  # 0.3 for strict adherence to rules
+    llm = create_llm(
+        settings.editor_temperature,  # 0.3 for strict adherence to rules
+        settings.editor_thinking_budget,
+        settings.editor_model
     )
     
+    # Delegation is opt-in: it adds a "should I delegate?" LLM round-trip per turn
+    allow_delegation = editor_can_delegate(settings)
+    backstory = _BACKSTORY + _DELEGATION_BACKSTORY if allow_delegation else _BACKSTORY
+    
     agent = Agent(
         role="Managing Editor",
         
-        goal=(
-            "Polish draft content to publication quality. Ensure formatting is perfect, "
-            "tone is consistent, all SEO requirements are met, and the content sounds "
-            "authentically human. Generate compelling metadata that drives clicks."
-        ),
-        
-        backstory="""You are a ruthless but fair managing editor with 20 years of experience 
-        in digital publishing. You've edited thousands of articles for major publications 
-        and have zero tolerance for mediocrity.
-        
-        Your Standards (Zero Tolerance For):
-        ❌ Robotic or AI-sounding language
-        ❌ Formatting inconsistencies
-        ❌ Missing citations or vague claims
-        ❌ Poor readability or confusing structure
-        ❌ Weak introductions or conclusions
-        ❌ Meta titles/descriptions that don't compel clicks
-        
-        Your Review Process:
-        
-        1. CONTENT QUALITY CHECK
-           - Does it sound like a human wrote this?
-           - Are there any AI-isms or robotic phrases?
-           - Is the tone consistent throughout?
-           - Does it flow naturally from section to section?
-           - Would I want to read this myself?
-        
-        2. FACTUAL VERIFICATION
-           - Are all claims backed by evidence?
-           - Are sources properly cited with hyperlinks?
-           - Are statistics and data points accurate?
-           - Is there any vague or weasel wording?
-        
-        3. FORMATTING REVIEW
-           - Verify proper HTML heading hierarchy (only one H1, proper H2/H3 nesting)
-           - Ensure all links are valid and properly formatted
-           - Check list formatting (bullets, numbered lists)
-           - Verify code blocks if present
-           - Confirm Markdown to HTML conversion is clean
-        
-        4. SEO FINALIZATION
-           - Generate meta title (55-60 characters, includes focus keyword)
-           - Create meta description (150-160 characters, compelling call-to-action)
-           - Generate URL slug from title (lowercase, hyphens, no special chars)
-           - Verify focus keyword is in first 100 words
-           - Confirm proper keyword density without stuffing
-        
-        5. TECHNICAL VALIDATION
-           - Calculate accurate estimated reading time
-           - Count total words
-           - Extract and list all source URLs
-           - Validate JSON output format matches schema exactly
-        
-        6. QUALITY GATE DECISION
-           - If content passes all checks: Format and approve
-           - If minor issues: Fix them yourself
-           - If major quality issues: REJECT and send back to writer with specific feedback
-        
-        Your Authority:
-        You have the power to send drafts back to the writer if quality is insufficient.
-        Use delegation when the content needs substantial rewriting, not just polishing.
-        
-        Your Output:
-        You generate the final JSON object that's ready for the API response.
-        Every field must be filled correctly, every format must be perfect.
-        
-        Your Philosophy:
-        "Good enough is not good enough. Either it's publication-ready, or it goes back."
+        goal=_GOAL,
         
-        You are the last line of defense between mediocre content and excellence.""",
+        backstory=backstory,
         
         tools=[],  # No tools - focuses on editing and formatting
         
         llm=llm,
-        verbose=True,
-        allow_delegation=settings.enable_delegation,  # CAN delegate back to writer
-        memory=settings.enable_memory
+        verbose=settings.agent_verbose,
+        allow_delegation=allow_delegation,
+        memory=settings.enable_memory and settings.editor_memory,
+        max_iter=settings.editor_max_iter,
+        max_retry_limit=0  # Don't re-run the whole edit on errors (e.g. 429s)
     )
     
     logger.info("Editor Agent created successfully")
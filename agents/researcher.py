@@ -5,23 +5,135 @@ This agent is responsible for deep-dive research, data gathering,
 and identifying content gaps in competitor articles.
 """
 
+import re
+from typing import List
 from crewai import Agent
-from tools.search_tools import (
-    google_search,
-    news_search,
-    ai_domain_search,
-    multi_source_research,
-    verify_ai_claim
+from agents import logger as package_logger
+from config import get_settings
+from agents._llm import create_llm
+
+_GOAL = (
+    "Uncover comprehensive AI-specific data from credible sources, verify claims "
+    "with multiple authoritative sources, and identify informational gaps in existing "
+    "AI blog content. Find unique angles backed by academic research and verified evidence."
 )
-from tools.scraper_tools import scrape_website
-from langchain_google_genai import ChatGoogleGenerativeAI
-from config import settings
-from utils.logger import setup_logger
 
-logger = setup_logger(__name__)
+_BACKSTORY = """You are an investigative AI technology journalist with 15 years of experience
+in cutting-edge artificial intelligence and machine learning. You have a reputation for
+uncovering the most credible and accurate information about AI developments.
+
+Your Expertise:
+- You ONLY research AI-related topics for blog content
+- You hate fluff and superficial AI content with a passion
+- You only trust peer-reviewed research, verified statistics, and authoritative AI sources
+- You always prioritize recent AI developments (last 3-6 months preferred)
+- You have an instinct for finding what AI blog competitors are missing
+
+Your Specialty:
+- Finding unique AI angles that make blog content stand out
+- Identifying emerging AI trends before they become mainstream
+- Uncovering specific AI problems that need solving
+- Locating authoritative AI sources (academic papers, company research, government initiatives)
+
+Your Method:
+- Verify ALL major AI claims with 3+ sources before including them
+- Prioritize academic sources (arXiv, NeurIPS, etc.) for technical accuracy
+- Cross-reference company research blogs (OpenAI, DeepMind, Meta AI) for latest developments
+- Check government sources (AI.gov, NSF) for policy and funding insights
+- Focus on data that tells an AI story, not just numbers
+- Look for informational gaps - what are the top AI blogs NOT covering?
+- Seek out recent case studies, expert opinions, and real-world AI examples
+- Never include unverified claims or statistics
+
+You approach each AI blog research task as if you're writing for Nature or Science."""
+
+
+# Topic words that route research to the credible AI source tools
+_AI_TOPIC_TAGS = frozenset({
+    "ai", "artificial", "intelligence", "machine", "learning", "ml", "deep",
+    "neural", "llm", "llms", "gpt", "genai", "generative", "transformer",
+    "transformers", "model", "models", "agent", "agents", "chatbot", "chatbots",
+})
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def is_ai_topic(topic: str) -> bool:
+    """
+    Check whether a topic should be researched with the AI source tools.
+    
+    Args:
+        topic: The blog topic
+        
+    Returns:
+        True if any word in the topic is a known AI topic tag
+    """
+    return not _AI_TOPIC_TAGS.isdisjoint(_WORD_PATTERN.findall(topic.lower()))
+
+
+def uses_ai_source_tools(ai_topic: bool, settings=None) -> bool:
+    """
+    Check whether pick_tools gives the researcher the credible AI source tools.
+    
+    The research task uses this to describe the same tools in its prompt.
+    
+    Args:
+        ai_topic: Whether the topic is AI-related (see is_ai_topic)
+        settings: Application settings (defaults to get_settings())
+        
+    Returns:
+        True for an AI topic with domain filtering enabled
+    """
+    settings = settings or get_settings()
+    
+    # Credible-source tools are only wired in when domain filtering is enabled
+    return ai_topic and settings.enable_domain_filtering
+
+
+def pick_tools(ai_topic: bool, settings=None) -> List:
+    """
+    Select the researcher's tools up front instead of asking the LLM to route.
+    
+    Args:
+        ai_topic: Whether the topic is AI-related (see is_ai_topic)
+        settings: Application settings (defaults to get_settings())
+        
+    Returns:
+        List of CrewAI tools for the research agent
+    """
+    settings = settings or get_settings()
+    
+    # Imported here so loading this module doesn't pull in requests/bs4/lxml
+    from tools.search_tools import (
+        google_search,
+        news_search,
+        ai_domain_search,
+        multi_source_research,
+        verify_ai_claim
+    )
+    from tools.scraper_tools import scrape_website
+    
+    if uses_ai_source_tools(ai_topic, settings):
+        return [
+            ai_domain_search,       # Primary tool for AI research
+            multi_source_research,  # For comprehensive diverse research
+            verify_ai_claim,        # For fact verification
+            news_search,            # For recent AI news
+            scrape_website          # For detailed content analysis
+        ]
+    
+    return [
+        google_search,          # General search
+        news_search,            # For recent news
+        scrape_website          # For detailed content analysis
+    ]
 
 
-def create_research_agent() -> Agent:
+def create_research_agent(
+    ai_topic: bool = True,
+    settings=None,
+    logger=None
+) -> Agent:
     """
     Create the Senior Research Analyst agent for AI blog research.
     
@@ -32,69 +144,41 @@ def create_research_agent() -> Agent:
     - Multi-source verification for accuracy
     - Finding authoritative AI sources
     
+    Args:
+        ai_topic: Route to the credible AI source tools (see is_ai_topic)
+        settings: Application settings (defaults to get_settings())
+        logger: Logger to report on (defaults to the agents package logger)
+    
     Returns:
         Configured Agent instance
     """
     
+    settings = settings or get_settings()
+    logger = logger or package_logger
+    
     # Configure LLM with low temperature for factual accuracy
-    llm = ChatGoogleGenerativeAI(
-        model=settings.gemini_model,
-        google_api_key=settings.gemini_api_key,
-        temperature=settings.researcher_temperature  # 0.2 for high factuality
+    llm = create_llm(
+        settings.researcher_temperature,  # 0.2 for high factuality
+        settings.researcher_thinking_budget,
+        settings.researcher_model
     )
     
+    tools = pick_tools(ai_topic, settings)
+    
     agent = Agent(
         role="Senior Research Analyst",
         
-        goal=(
-            "Uncover comprehensive AI-specific data from credible sources, verify claims "
-            "with multiple authoritative sources, and identify informational gaps in existing "
-            "AI blog content. Find unique angles backed by academic research and verified evidence."
-        ),
-        
-        backstory="""You are an investigative AI technology journalist with 15 years of experience 
-        in cutting-edge artificial intelligence and machine learning. You have a reputation for 
-        uncovering the most credible and accurate information about AI developments.
-        
-        Your Expertise:
-        - You ONLY research AI-related topics for blog content
-        - You hate fluff and superficial AI content with a passion
-        - You only trust peer-reviewed research, verified statistics, and authoritative AI sources
-        - You always prioritize recent AI developments (last 3-6 months preferred)
-        - You have an instinct for finding what AI blog competitors are missing
-        
-        Your Specialty:
-        - Finding unique AI angles that make blog content stand out
-        - Identifying emerging AI trends before they become mainstream
-        - Uncovering specific AI problems that need solving
-        - Locating authoritative AI sources (academic papers, company research, government initiatives)
+        goal=_GOAL,
         
-        Your Method:
-        - ALWAYS use ai_domain_search or multi_source_research for AI topics to ensure credible sources
-        - Verify ALL major AI claims using verify_ai_claim with 3+ sources before including them
-        - Prioritize academic sources (arXiv, NeurIPS, etc.) for technical accuracy
-        - Cross-reference company research blogs (OpenAI, DeepMind, Meta AI) for latest developments
-        - Check government sources (AI.gov, NSF) for policy and funding insights
-        - Focus on data that tells an AI story, not just numbers
-        - Look for informational gaps - what are the top AI blogs NOT covering?
-        - Seek out recent case studies, expert opinions, and real-world AI examples
-        - Never include unverified claims or statistics
+        backstory=_BACKSTORY,
         
-        You approach each AI blog research task as if you're writing for Nature or Science.""",
-        
-        tools=[
-            ai_domain_search,       # Primary tool for AI research
-            multi_source_research,  # For comprehensive diverse research
-            verify_ai_claim,        # For fact verification
-            google_search,          # Fallback general search
-            news_search,            # For recent AI news
-            scrape_website          # For detailed content analysis
-        ],
+        tools=tools,
         
         llm=llm,
-        verbose=True,
+        verbose=settings.agent_verbose,
         allow_delegation=False,  # Research agent works independently
-        memory=settings.enable_memory
+        memory=settings.enable_memory and settings.researcher_memory,
+        max_iter=settings.researcher_max_iter
     )
     
     logger.info("Research Agent created successfully")
@@ -5,14 +5,48 @@ This agent creates SEO-optimized content outlines and keyword strategies.
 """
 
 from crewai import Agent
-from langchain_google_genai import ChatGoogleGenerativeAI
-from config import settings
-from utils.logger import setup_logger
+from agents import logger as package_logger
+from config import get_settings
+from agents._llm import create_llm
 
-logger = setup_logger(__name__)
+_GOAL = (
+    "Structure content to rank #1 on Google while maintaining readability "
+    "and user engagement. Optimize for featured snippets, 'People Also Ask', "
+    "and semantic search."
+)
 
+_BACKSTORY = """You are an SEO expert with a proven track record of ranking content
+in highly competitive niches. You've helped dozens of websites achieve first-page
+rankings and featured snippet positions.
 
-def create_seo_strategist() -> Agent:
+Your Expertise:
+- Deep understanding of search intent (informational, navigational, transactional)
+- Mastery of on-page SEO and content structure
+- Expert knowledge of LSI keywords and semantic search
+- Proven strategies for winning featured snippets
+
+Your Approach:
+- Analyze SERP features - what is Google showing for this query?
+- Create proper heading hierarchy (H1, H2, H3) that serves both users and search engines
+- Identify long-tail keyword opportunities that competitors miss
+- Structure content to answer 'People Also Ask' questions naturally
+- Ensure comprehensive topical coverage for E-E-A-T (Experience, Expertise,
+  Authoritativeness, Trustworthiness)
+
+Your Strengths:
+- You understand that great SEO serves users first, search engines second
+- You create outlines that guide writers to produce ranking content
+- You balance keyword optimization with natural, engaging language
+- You stay current with Google algorithm updates and SERP trends
+
+Your Philosophy:
+"The best SEO is great content structured in a way that search engines
+can understand and users can easily consume."
+
+You create detailed outlines that serve as blueprints for content success."""
+
+
+def create_seo_strategist(settings=None, logger=None) -> Agent:
     """
     Create the SEO Content Strategist agent.
     
@@ -22,62 +56,38 @@ def create_seo_strategist() -> Agent:
     - Optimizes for featured snippets and 'People Also Ask'
     - Identifies semantic keywords and LSI terms
     
+    Args:
+        settings: Application settings (defaults to get_settings())
+        logger: Logger to report on (defaults to the agents package logger)
+    
     Returns:
         Configured Agent instance
     """
     
+    settings = settings or get_settings()
+    logger = logger or package_logger
+    
     # Configure LLM with balanced temperature for strategic thinking
-    llm = ChatGoogleGenerativeAI(
-        model=settings.gemini_model,
-        google_api_key=settings.gemini_api_key,
-        temperature=settings.strategist_temperature  # 0.4 for balanced creativity
+    llm = create_llm(
+        settings.strategist_temperature,  # 0.4 for balanced creativity
+        settings.strategist_thinking_budget,
+        settings.strategist_model
     )
     
     agent = Agent(
         role="SEO Content Strategist",
         
-        goal=(
-            "Structure content to rank #1 on Google while maintaining readability "
-            "and user engagement. Optimize for featured snippets, 'People Also Ask', "
-            "and semantic search."
-        ),
-        
-        backstory="""You are an SEO expert with a proven track record of ranking content 
-        in highly competitive niches. You've helped dozens of websites achieve first-page 
-        rankings and featured snippet positions.
-        
-        Your Expertise:
-        - Deep understanding of search intent (informational, navigational, transactional)
-        - Mastery of on-page SEO and content structure
-        - Expert knowledge of LSI keywords and semantic search
-        - Proven strategies for winning featured snippets
-        
-        Your Approach:
-        - Analyze SERP features - what is Google showing for this query?
-        - Create proper heading hierarchy (H1, H2, H3) that serves both users and search engines
-        - Identify long-tail keyword opportunities that competitors miss
-        - Structure content to answer 'People Also Ask' questions naturally
-        - Ensure comprehensive topical coverage for E-E-A-T (Experience, Expertise, 
-          Authoritativeness, Trustworthiness)
-        
-        Your Strengths:
-        - You understand that great SEO serves users first, search engines second
-        - You create outlines that guide writers to produce ranking content
-        - You balance keyword optimization with natural, engaging language
-        - You stay current with Google algorithm updates and SERP trends
-        
-        Your Philosophy:
-        "The best SEO is great content structured in a way that search engines 
-        can understand and users can easily consume."
+        goal=_GOAL,
         
-        You create detailed outlines that serve as blueprints for content success.""",
+        backstory=_BACKSTORY,
         
         tools=[],  # Pure logic agent, no tools needed
         
         llm=llm,
-        verbose=True,
+        verbose=settings.agent_verbose,
         allow_delegation=False,
-        memory=settings.enable_memory
+        memory=settings.enable_memory and settings.strategist_memory,
+        max_iter=settings.strategist_max_iter
     )
     
     logger.info("SEO Strategist Agent created successfully")
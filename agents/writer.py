@@ -5,14 +5,60 @@ This agent creates engaging, human-sounding content following the SEO outline.
 """
 
 from crewai import Agent
-from langchain_google_genai import ChatGoogleGenerativeAI
-from config import settings
-from utils.logger import setup_logger
+from agents import logger as package_logger
+from config import get_settings
+from agents._llm import create_llm
+from utils.helpers import BANNED_PHRASES
 
-logger = setup_logger(__name__)
+_GOAL = (
+    "Write engaging, human-sounding content that follows the strategic outline "
+    "while maintaining a natural, authoritative voice. Create content that readers "
+    "actually want to read and share."
+)
 
+_BANNED_PHRASES = ", ".join(BANNED_PHRASES)
 
-def create_writer_agent() -> Agent:
+_BACKSTORY = """You are a professional copywriter and content creator with expertise
+in technical and business writing. You've written for major publications and have
+a gift for making complex topics accessible and engaging.
+
+Your Writing Style:
+- Conversational yet authoritative - like explaining to a smart friend
+- Clear and direct - no beating around the bush
+- Engaging and human - readers feel like a person wrote this, not a machine
+- Evidence-based - claims are backed up with data and citations
+
+Your Writing Principles:
+✓ Use short paragraphs (2-4 sentences max) for easy scanning
+✓ Include bullet points and numbered lists for scannability
+✓ Use analogies and examples to explain complex concepts
+✓ Write in active voice whenever possible
+✓ Vary sentence length for better flow and rhythm
+✓ Use subheadings to break up long sections
+✓ Include transitions between sections for smooth reading
+
+BANNED PHRASES (never use): {banned}, or anything else that sounds AI-written.
+
+Your Process:
+1. Strictly follow the structural outline provided by the SEO Strategist
+2. Write in Markdown format with proper formatting
+3. Cite sources using inline hyperlinks: [source text](URL)
+4. Include specific examples, statistics, and real-world applications
+5. Make every paragraph earn its place - cut fluff ruthlessly
+
+Your Standards:
+- If you wouldn't read it yourself, rewrite it
+- Every claim needs evidence or a citation
+- Every paragraph should add value
+- Every sentence should be clear on first reading
+
+Your Mission:
+Write content so good that readers forget they're reading content.""".format(
+    banned=_BANNED_PHRASES
+)
+
+
+def create_writer_agent(settings=None, logger=None) -> Agent:
     """
     Create the Lead Content Writer agent.
     
@@ -23,76 +69,38 @@ def create_writer_agent() -> Agent:
     - Uses Markdown formatting
     - Cites sources properly
     
+    Args:
+        settings: Application settings (defaults to get_settings())
+        logger: Logger to report on (defaults to the agents package logger)
+    
     Returns:
         Configured Agent instance
     """
     
+    settings = settings or get_settings()
+    logger = logger or package_logger
+    
     # Configure LLM with higher temperature for creative writing
-    llm = ChatGoogleGenerativeAI(
-        model=settings.gemini_model,
-        google_api_key=settings.gemini_api_key,
-        temperature=settings.writer_temperature  # 0.7 for engaging, creative writing
+    llm = create_llm(
+        settings.writer_temperature,  # 0.7 for engaging, creative writing
+        settings.writer_thinking_budget,
+        settings.writer_model
     )
     
     agent = Agent(
         role="Lead Content Writer",
         
-        goal=(
-            "Write engaging, human-sounding content that follows the strategic outline "
-            "while maintaining a natural, authoritative voice. Create content that readers "
-            "actually want to read and share."
-        ),
-        
-        backstory="""You are a professional copywriter and content creator with expertise 
-        in technical and business writing. You've written for major publications and have 
-        a gift for making complex topics accessible and engaging.
-        
-        Your Writing Style:
-        - Conversational yet authoritative - like explaining to a smart friend
-        - Clear and direct - no beating around the bush
-        - Engaging and human - readers feel like a person wrote this, not a machine
-        - Evidence-based - claims are backed up with data and citations
-        
-        Your Writing Principles:
-        ✓ Use short paragraphs (2-4 sentences max) for easy scanning
-        ✓ Include bullet points and numbered lists for scannability
-        ✓ Use analogies and examples to explain complex concepts
-        ✓ Write in active voice whenever possible
-        ✓ Vary sentence length for better flow and rhythm
-        ✓ Use subheadings to break up long sections
-        ✓ Include transitions between sections for smooth reading
-        
-        BANNED WORDS AND PHRASES (you NEVER use these AI-isms):
-        ❌ "unleash", "unlock", "delve", "dive deep into"
-        ❌ "landscape", "game-changer", "cutting-edge" (unless truly revolutionary)
-        ❌ "revolutionary", "groundbreaking" (unless backed by evidence)
-        ❌ "in today's world", "in this day and age"
-        ❌ "it's no secret that", "needless to say"
-        ❌ "at the end of the day", "when all is said and done"
-        ❌ Any phrase that screams "I was written by AI"
-        
-        Your Process:
-        1. Strictly follow the structural outline provided by the SEO Strategist
-        2. Write in Markdown format with proper formatting
-        3. Cite sources using inline hyperlinks: [source text](URL)
-        4. Include specific examples, statistics, and real-world applications
-        5. Make every paragraph earn its place - cut fluff ruthlessly
-        
-        Your Standards:
-        - If you wouldn't read it yourself, rewrite it
-        - Every claim needs evidence or a citation
-        - Every paragraph should add value
-        - Every sentence should be clear on first reading
+        goal=_GOAL,
         
-        Your Mission:
-        Write content so good that readers forget they're reading content.""",
+        backstory=_BACKSTORY,
         
         tools=[],  # No tools - focuses on writing
         
         llm=llm,
-        verbose=True,
+        verbose=settings.agent_verbose,
         allow_delegation=False,
-        memory=settings.enable_memory
+        memory=settings.enable_memory and settings.writer_memory,
+        max_iter=settings.writer_max_iter
     )
     
     logger.info("Writer Agent created successfully")
@@ -4,9 +4,10 @@ Configuration management for Blog Brain using Pydantic Settings.
 This module handles all environment variables and application settings.
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator
-from typing import List, Union
+from pydantic import AliasGenerator, field_validator
+from typing import Optional, Tuple, Union
 
 
 class Settings(BaseSettings):
@@ -25,9 +26,11 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_reload: bool = True
+    api_workers: int = 1                 # Worker processes (ignored with reload)
+    enable_docs: bool = True             # Serve /docs and /redoc (disable in production)
     
     # CORS Settings (can be comma-separated string or list)
-    allowed_origins: Union[List[str], str] = ["http://localhost:3000"]
+    allowed_origins: Union[Tuple[str, ...], str] = ("http://localhost:3000",)
     
     # Logging
     log_level: str = "INFO"
@@ -38,6 +41,38 @@ class Settings(BaseSettings):
     writer_temperature: float = 0.7      # High for creative writing
     editor_temperature: float = 0.3      # Low for consistency
     
+    # Agent Model Overrides (Gemini quotas are per model; unset uses gemini_model)
+    researcher_model: Optional[str] = None
+    strategist_model: Optional[str] = None
+    writer_model: Optional[str] = None
+    editor_model: Optional[str] = None
+    
+    # Agent Thinking Budgets (Gemini thinking tokens; 0 disables, -1 is dynamic)
+    researcher_thinking_budget: int = 0    # Tool-use heavy, no long reasoning needed
+    strategist_thinking_budget: int = 512
+    writer_thinking_budget: int = 512
+    editor_thinking_budget: int = 0        # Deterministic formatting
+    
+    # Stream LLM tokens instead of waiting for the full completion
+    enable_llm_streaming: bool = True
+    
+    # Result Cache (finished articles and research briefs, on disk)
+    enable_result_cache: bool = True
+    result_cache_dir: str = ".result_cache"
+    cache_ttl_hours: float = 24.0
+    memory_cache_size: int = 128         # In-process LRU entries (0 disables)
+    
+    # Process-wide Gemini rate limit shared by every agent and crew run
+    rpm_limit: int = 30                  # Requests per minute (0 disables)
+    
+    # Keep-alive connections per host for search/scraper tools
+    http_pool_size: int = 20
+    http_retries: int = 3                # Retries on connection errors, 429 and 5xx
+    
+    # Check cited source URLs after editing (HEAD requests, pooled)
+    verify_source_links: bool = False
+    link_check_timeout: float = 5.0      # Seconds per link
+    
     # Research Enhancement for AI Blogs
     enable_domain_filtering: bool = True          # Enable AI credible source filtering
     enable_fact_verification: bool = True         # Enable multi-source verification
@@ -46,25 +81,60 @@ class Settings(BaseSettings):
     prioritize_academic_sources: bool = True      # Prioritize academic over other sources
     
     # CrewAI Settings
-    enable_memory: bool = True           # Agents remember context
-    enable_delegation: bool = True       # Agents can delegate tasks
-    max_iterations: int = 3              # Max task iterations
+    parallel_research_strategy: bool = True  # Run research and strategy concurrently
+    fuse_writing_editing: bool = False   # Writer self-edits and returns the final JSON (no editor call)
+    agent_verbose: bool = False          # Detailed per-step agent logs (dev only)
+    enable_memory: bool = True           # Memory master switch (crew memory needs a scope id)
+    researcher_memory: bool = False      # Agent memory is unscoped: shared by every request
+    strategist_memory: bool = False      # Single-shot outline, no recall needed
+    writer_memory: bool = False
+    editor_memory: bool = False
+    enable_delegation: bool = False      # Agents can delegate tasks (opt-in)
+    editor_allow_delegation: bool = False  # Editor can send drafts back to the writer
+    researcher_max_iter: int = 3         # Tool-use loop needs a few rounds
+    strategist_max_iter: int = 1         # Single deterministic outline
+    writer_max_iter: int = 2
+    editor_max_iter: int = 1             # Single deterministic edit pass
+    max_concurrent_generations: int = 2  # Parallel crew runs (API worker threads, generate_many)
+    max_queued_generations: int = 2      # API requests that may wait for a crew thread (then 429)
     
     @field_validator('allowed_origins', mode='before')
     @classmethod
     def parse_origins(cls, v):
-        """Parse comma-separated string into list"""
+        """Parse comma-separated string into a tuple (keeps Settings hashable)"""
         if isinstance(v, str):
-            return [x.strip() for x in v.split(',')]
-        return v
+            return tuple(x.strip() for x in v.split(','))
+        return tuple(v)
     
+    # Env vars are matched case-sensitively against their UPPER_SNAKE_CASE
+    # names (GEMINI_API_KEY -> gemini_api_key), skipping per-key lowercasing
     model_config = SettingsConfigDict(
         env_file=".env",
-        case_sensitive=False,
-        extra='ignore'
+        case_sensitive=True,
+        alias_generator=AliasGenerator(validation_alias=str.upper),
+        populate_by_name=True,
+        extra='ignore',
+        frozen=True
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, constructing them on first use.
+    
+    The instance is cached for the lifetime of the process. Tests can
+    force a reload with ``get_settings.cache_clear()``.
+    
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """Resolve the module-level ``settings`` lazily (``from config import settings``)."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
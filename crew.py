@@ -5,34 +5,475 @@ This module orchestrates the multi-agent content generation workflow,
 connecting all agents and tasks in a sequential process.
 """
 
-from crewai import Crew, Process
-from tasks.research_task import create_research_task
-from tasks.strategy_task import create_strategy_task
-from tasks.writing_task import create_writing_task
-from tasks.editing_task import create_editing_task
 from utils.logger import setup_logger
+from utils.cache import make_cache_key, cache_get, cache_put, canonical_topic
+from utils.helpers import find_ai_isms, find_phrases, lix_score, markdown_to_html, readability_bucket
+from utils.http import check_urls
+from schemas.request_schema import ContentGenerationRequest
+from schemas.response_schema import ContentDataResponse, EditorOutput
+from pydantic import ValidationError
 from config import settings
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, Iterator, Optional, List, NamedTuple, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+import asyncio
 import json
+import re
+import threading
 import time
+from datetime import datetime
+import orjson
+
+# CrewAI and the task factories (which build the agents) are imported where
+# a crew is assembled, so importing this module stays cheap
+if TYPE_CHECKING:
+    from crewai import Crew
+
+__all__ = ["ContentGenerationCrew", "create_crew"]
 
 logger = setup_logger(__name__)
 
+# Log banner and divider lines
+_EQ = "=" * 60
+_DASH = "-" * 60
+
+# Fenced ```json block from the editor (closing fence required), falling back
+# to the outermost {...} span when the editor skips the fence
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL | re.IGNORECASE)
+_BRACE_SPAN = re.compile(r"\{.*\}", re.DOTALL)
+
+# Incremental parsing of the streamed editor JSON
+_METADATA_KEY = re.compile(r'"metadata"\s*:\s*')
+_BODY_KEY = re.compile(r'"markdown_body"\s*:\s*"')
+_STRING_RUN = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL)
+# An unescaped trailing \uXXXX fragment, or a high surrogate still waiting
+# for its low half; decoding either on its own yields lone surrogates
+_PARTIAL_ESCAPE = re.compile(
+    r'(?<!\\)(?:\\\\)*((?:\\u[dD][89abAB][0-9a-fA-F]{2})?(?:\\u[0-9a-fA-F]{0,3})?)$'
+)
+_STREAM_DECODER = json.JSONDecoder(strict=False)
+
+
+def _split_result(result: Any) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Split a crew result into structured data (if any) and raw text.
+    
+    Args:
+        result: Output from crew.kickoff(), a dict, or a string
+        
+    Returns:
+        Tuple of (structured data or None, raw text output)
+    """
+    # Structured output (a dict, or a CrewOutput with json_dict/pydantic
+    # set) needs no text extraction
+    if isinstance(result, dict):
+        return result, ""
+    if getattr(result, "json_dict", None):
+        return result.json_dict, result.raw
+    if getattr(result, "pydantic", None) is not None:
+        return result.pydantic.model_dump(), result.raw
+    
+    # CrewAI returns a result object with raw string output
+    raw_output = getattr(result, "raw", None)
+    return None, raw_output if isinstance(raw_output, str) else str(result)
+
+
+def _plain_text_output(raw_output: str) -> Dict[str, Any]:
+    """
+    Wrap unstructured editor text as markdown content.
+    
+    Args:
+        raw_output: Raw text returned by the editor
+        
+    Returns:
+        Editor data with placeholder metadata and the text as the body
+    """
+    return {
+        "metadata": {
+            "seo_title": "Generated Content",
+            "meta_description": "AI-generated content",
+            "slug": "generated-content",
+            "focus_keyword": "content",
+            "estimated_read_time": "5 mins",
+            "word_count": len(raw_output.split())
+        },
+        "content": {
+            "markdown_body": raw_output,
+            "html_body": markdown_to_html(raw_output)
+        }
+    }
+
+
+class _EditorStreamParser:
+    """
+    Surfaces editor JSON fields while the editor is still generating.
+    
+    Emits the metadata object as soon as it is complete, then the
+    markdown body as decoded text deltas.
+    """
+    
+    def __init__(self):
+        self._buffer = ""
+        self._metadata_sent = False
+        self._body_pos: Optional[int] = None
+        self._body_done = False
+    
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Add streamed text and return any events it completes.
+        
+        Args:
+            text: Next chunk of editor output
+            
+        Returns:
+            List of {"event": "metadata" | "content", "data": ...} dicts
+        """
+        self._buffer += text
+        events = []
+        
+        if not self._metadata_sent:
+            match = _METADATA_KEY.search(self._buffer)
+            if match:
+                try:
+                    metadata, _ = _STREAM_DECODER.raw_decode(self._buffer, match.end())
+                except json.JSONDecodeError:
+                    pass  # Object still incomplete
+                else:
+                    self._metadata_sent = True
+                    events.append({"event": "metadata", "data": metadata})
+        
+        if self._body_pos is None:
+            match = _BODY_KEY.search(self._buffer)
+            if match:
+                self._body_pos = match.end()
+        
+        if self._body_pos is not None and not self._body_done:
+            end = _STRING_RUN.match(self._buffer, self._body_pos).end()
+            self._body_done = self._buffer[end:end + 1] == '"'  # Closing quote seen
+            
+            segment = self._buffer[self._body_pos:end]
+            if not self._body_done:
+                # Hold back a \uXXXX escape or surrogate pair split across chunks
+                segment = segment[:_PARTIAL_ESCAPE.search(segment).start(1)]
+            
+            if segment:
+                self._body_pos += len(segment)
+                events.append({
+                    "event": "content",
+                    "data": _STREAM_DECODER.decode(f'"{segment}"')
+                })
+        
+        return events
+
+
+def _stage_models() -> Dict[str, str]:
+    """Resolve the Gemini model each agent role runs on."""
+    return {
+        role: getattr(settings, f"{role}_model") or settings.gemini_model
+        for role in ("researcher", "strategist", "writer", "editor")
+    }
+
+
+def _content_key(
+    topic: str,
+    target_audience: Optional[str],
+    tone: str,
+    exclude_keywords: Optional[List[str]]
+) -> str:
+    """
+    Build the result cache key for a finished article.
+    
+    The key includes every stage's model and the settings that change
+    the workflow (AI source filtering, fused writing and editing), so
+    switching them doesn't serve articles written the previous way.
+    """
+    return make_cache_key(
+        "content",
+        topic=canonical_topic(topic),
+        target_audience=target_audience,
+        tone=tone,
+        exclude_keywords=sorted(exclude_keywords or ()),
+        domain_filtering=settings.enable_domain_filtering,
+        fused_editing=settings.fuse_writing_editing,
+        models=_stage_models()
+    )
+
+
+def _stage_keys(
+    topic: str,
+    target_audience: Optional[str],
+    tone: str,
+    exclude_keywords: Optional[List[str]]
+) -> Dict[str, str]:
+    """
+    Build the result cache keys for the stages a run can resume from.
+    
+    Research and strategy don't depend on exclude_keywords, so keyword
+    variants of a request reuse both. The research brief doesn't depend
+    on tone either, so tone variants share it. Strategy is keyed on
+    whether it was planned from the research findings. Every stage builds
+    on research, so all are keyed on AI source filtering.
+    """
+    stage_models = _stage_models()
+    stage_keys = {
+        "research": make_cache_key(
+            "research",
+            topic=canonical_topic(topic),
+            target_audience=target_audience,
+            domain_filtering=settings.enable_domain_filtering,
+            model=stage_models["researcher"]
+        ),
+        "strategy": make_cache_key(
+            "strategy",
+            topic=canonical_topic(topic),
+            target_audience=target_audience,
+            tone=tone,
+            research_context=not settings.parallel_research_strategy,
+            domain_filtering=settings.enable_domain_filtering,
+            models=[stage_models["researcher"], stage_models["strategist"]]
+        )
+    }
+    if not settings.fuse_writing_editing:
+        # A finished draft lets a retry after an editor failure
+        # resume at the editing stage
+        stage_keys["writing"] = make_cache_key(
+            "writing",
+            topic=canonical_topic(topic),
+            target_audience=target_audience,
+            tone=tone,
+            exclude_keywords=sorted(exclude_keywords or ()),
+            domain_filtering=settings.enable_domain_filtering,
+            models=[stage_models[role] for role in ("researcher", "strategist", "writer")]
+        )
+    return stage_keys
+
+
+def _cached_stages(stage_keys: Dict[str, str]) -> Dict[str, str]:
+    """Fetch the stage outputs already in the result cache, by stage name."""
+    cached_stages = {}
+    for name, key in stage_keys.items():
+        stage_output = cache_get(key)
+        if stage_output is not None:
+            cached_stages[name] = stage_output
+    return cached_stages
+
+
+def _restore_stages(stages: Dict[str, Any], cached_stages: Dict[str, str]) -> None:
+    """
+    Prepare stage outputs for a run (hold the crew lock).
+    
+    Tasks left out of the crew get their cached output. The rest are
+    cleared: crews are reused across requests, so an output left over
+    from an earlier run would otherwise be checkpointed as this run's.
+    """
+    from crewai.tasks.task_output import TaskOutput
+    
+    for name, task in stages.items():
+        stage_output = cached_stages.get(name)
+        if stage_output is None:
+            task.output = None
+            continue
+        logger.info("⚡ Using cached %s output", name)
+        task.output = TaskOutput(
+            description=task.description,
+            raw=stage_output,
+            agent=task.agent.role
+        )
+
+
+def _checkpoint_stages(
+    stages: Dict[str, Any],
+    stage_keys: Dict[str, str],
+    cached_stages: Dict[str, str]
+) -> None:
+    """
+    Cache the stages this run finished.
+    
+    Called even when a later stage failed, so a retry picks up where the
+    run stopped. Relies on _restore_stages having cleared the outputs of
+    the stages that were due to run.
+    """
+    for name, key in stage_keys.items():
+        if name not in cached_stages and stages[name].output is not None:
+            cache_put(key, stages[name].output.raw)
+
+
+async def _acquire_crew_lock(lock: threading.Lock) -> None:
+    """
+    Wait for a crew lock without blocking the event loop.
+    
+    The wait runs in a worker thread that can't be interrupted. If the
+    waiting task is cancelled, the lock is released as soon as that
+    thread gets it, so a disconnected client doesn't leave it held.
+    """
+    acquiring = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+    try:
+        await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        acquiring.add_done_callback(
+            lambda future: future.cancelled() or lock.release()
+        )
+        raise
+
+
+@contextmanager
+def _private_llms(crew: "Crew") -> Iterator[None]:
+    """
+    Give the crew's agents their own copies of their LLMs for one run.
+    
+    A streaming kickoff sets stream=True on every agent's LLM and leaves
+    it set. create_llm shares those LLMs across all crews, so the run
+    works on shallow copies (same Gemini client) and the shared ones are
+    put back afterwards.
+    """
+    shared_llms = [agent.llm for agent in crew.agents]
+    for agent in crew.agents:
+        agent.llm = agent.llm.model_copy()
+    try:
+        yield
+    finally:
+        for agent, llm in zip(crew.agents, shared_llms):
+            agent.llm = llm
+
+
+class _CrewEntry(NamedTuple):
+    """An assembled crew plus what generate_content needs around its runs."""
+    
+    crew: "Crew"
+    stages: Dict[str, Any]  # Stage name -> Task, including skipped stages
+    lock: threading.Lock
+
+
+@lru_cache(maxsize=32)
+def _build_crew(
+    topic: str,
+    target_audience: Optional[str],
+    tone: str,
+    exclude_keywords: Tuple[str, ...],
+    skip_stages: Tuple[str, ...] = (),
+    memory_scope_id: Optional[str] = None
+) -> _CrewEntry:
+    """
+    Build (or fetch from cache) the crew for one set of inputs.
+    
+    Task prompts are rendered from the inputs, so the cache key is the full
+    input tuple. Repeat requests skip task construction, context wiring and
+    Crew validation.
+    
+    Args:
+        topic: The blog topic to write about
+        target_audience: Optional target audience specification
+        tone: Writing tone
+        exclude_keywords: Keywords/phrases to avoid (hashable)
+        skip_stages: Stages ("research", "strategy", "writing") to leave
+                     out of the crew; the caller sets their task output
+                     from the stage cache
+        memory_scope_id: Namespace for crew memory; memory stays off
+                         without one
+        
+    Returns:
+        _CrewEntry with the assembled Crew, its tasks by stage and run lock
+    """
+    
+    from crewai import Crew, Process
+    from agents._llm import get_rpm_controller
+    from tasks import (
+        create_research_task,
+        create_strategy_task,
+        create_writing_task,
+        create_editing_task
+    )
+    
+    # Create all tasks
+    logger.info("Creating tasks...")
+    
+    research_task = create_research_task(topic, target_audience)
+    logger.debug("✓ Research task created")
+    
+    strategy_task = create_strategy_task(
+        topic, tone, research_context=not settings.parallel_research_strategy
+    )
+    logger.debug("✓ Strategy task created")
+    
+    # A fused writer produces the final JSON itself, saving the editor call
+    fuse_editing = settings.fuse_writing_editing
+    writing_task = create_writing_task(list(exclude_keywords) or None, finalize=fuse_editing)
+    logger.debug("✓ Writing task created")
+    
+    editing_task = None if fuse_editing else create_editing_task()
+    if editing_task is not None:
+        logger.debug("✓ Editing task created")
+    
+    # Link tasks with context flow
+    # Each task receives output from previous tasks as context
+    logger.info("Linking task contexts...")
+    if settings.parallel_research_strategy:
+        # Strategy only needs the topic, so research and strategy run
+        # concurrently and fan in at the writing task, which waits for both
+        research_task.async_execution = True
+        strategy_task.async_execution = True
+    else:
+        strategy_task.context = [research_task]
+    writing_task.context = [research_task, strategy_task]
+    if editing_task is not None:
+        editing_task.context = [research_task, strategy_task, writing_task]
+    logger.info("✓ Task context chain established")
+    
+    # Create the crew
+    logger.info("Assembling the crew...")
+    stages = {
+        "research": research_task,
+        "strategy": strategy_task,
+        "writing": writing_task
+    }
+    if editing_task is not None:
+        stages["editing"] = editing_task
+    
+    # A cached stage output stands in for its run: the task stays in the
+    # writing/editing context but is not executed
+    tasks = [task for name, task in stages.items() if name not in skip_stages]
+    
+    # One request budget for the whole process, not one per crew
+    rpm_controller = get_rpm_controller()
+    if rpm_controller is not None:
+        for task in tasks:
+            task.agent.set_rpm_controller(rpm_controller)
+    
+    # Crew memory only helps when requests share a scope; the crew name
+    # namespaces the memory store so scopes never recall each other
+    use_memory = settings.enable_memory and memory_scope_id is not None
+    scope_kwargs = {"name": f"blog-brain-{memory_scope_id}"} if use_memory else {}
+    
+    crew = Crew(
+        agents=[task.agent for task in tasks],
+        tasks=tasks,
+        process=Process.sequential,  # Tasks execute in order (async ones overlap)
+        verbose=settings.agent_verbose,  # CrewAI console output (dev only)
+        memory=use_memory,            # Scoped requests remember context
+        **scope_kwargs
+    )
+    
+    logger.info("✓ Crew assembled with %d agents", len(tasks))
+    
+    return _CrewEntry(crew, stages, threading.Lock())
+
 
 class ContentGenerationCrew:
     """
     Orchestrates the multi-agent content generation workflow.
     
-    The crew executes 4 sequential tasks:
+    The crew executes 4 tasks:
     1. Research - Gather comprehensive information
-    2. Strategy - Create SEO-optimized outline
+    2. Strategy - Create SEO-optimized outline (concurrently with research)
     3. Writing - Generate engaging article
-    4. Editing - Quality assurance and finalization
+    4. Editing - Quality assurance and finalization (done by the writer
+       when settings.fuse_writing_editing is on)
     """
     
     def __init__(self):
         """Initialize the content generation crew."""
         self.logger = logger
+        self._scoped_crews: Dict[str, _CrewEntry] = {}
         self.logger.info("Content Generation Crew initialized")
     
     def generate_content(
@@ -40,7 +481,8 @@ class ContentGenerationCrew:
         topic: str,
         target_audience: Optional[str] = None,
         tone: str = "professional",
-        exclude_keywords: Optional[List[str]] = None
+        exclude_keywords: Optional[List[str]] = None,
+        memory_scope_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Execute the full content generation workflow.
@@ -53,6 +495,8 @@ class ContentGenerationCrew:
             target_audience: Optional target audience specification
             tone: Writing tone (professional, casual, technical, conversational)
             exclude_keywords: Optional list of keywords/phrases to avoid
+            memory_scope_id: Optional namespace (e.g. a tenant or series id)
+                             for crew memory; without one the run is stateless
             
         Returns:
             Dictionary with generated content, metadata, and sources
@@ -68,215 +512,607 @@ class ContentGenerationCrew:
             'success'
         """
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
+        # Reject bad inputs before any task or crew is built
         try:
-            self.logger.info("=" * 60)
-            self.logger.info(f"Starting content generation for topic: '{topic}'")
-            self.logger.info(f"Target audience: {target_audience or 'General'}")
-            self.logger.info(f"Tone: {tone}")
-            self.logger.info("=" * 60)
-            
-            # Create all tasks
-            self.logger.info("Creating tasks...")
-            
-            research_task = create_research_task(topic, target_audience)
-            self.logger.info("✓ Research task created")
-            
-            strategy_task = create_strategy_task(topic, tone)
-            self.logger.info("✓ Strategy task created")
-            
-            writing_task = create_writing_task(exclude_keywords)
-            self.logger.info("✓ Writing task created")
-            
-            editing_task = create_editing_task()
-            self.logger.info("✓ Editing task created")
-            
-            # Link tasks with context flow
-            # Each task receives output from previous tasks as context
-            self.logger.info("Linking task contexts...")
-            strategy_task.context = [research_task]
-            writing_task.context = [research_task, strategy_task]
-            editing_task.context = [research_task, strategy_task, writing_task]
-            self.logger.info("✓ Task context chain established")
-            
-            # Create the crew
-            self.logger.info("Assembling the crew...")
-            crew = Crew(
-                agents=[
-                    research_task.agent,
-                    strategy_task.agent,
-                    writing_task.agent,
-                    editing_task.agent
-                ],
-                tasks=[
-                    research_task,
-                    strategy_task,
-                    writing_task,
-                    editing_task
-                ],
-                process=Process.sequential,  # Tasks execute in order
-                verbose=True,                 # Show detailed execution logs
-                memory=settings.enable_memory,  # Agents remember context
-                max_rpm=30  # Rate limiting: max 30 requests per minute
+            request = ContentGenerationRequest(
+                topic=topic,
+                target_audience=target_audience,
+                tone=tone,
+                exclude_keywords=exclude_keywords
             )
+        except ValidationError as e:
+            return self._invalid_request(e, start_time, topic)
+        
+        topic = request.topic
+        target_audience = request.target_audience
+        tone = request.tone
+        exclude_keywords = request.exclude_keywords
+        
+        try:
+            self.logger.info(_EQ)
+            self.logger.info("Starting content generation for topic: '%s'", topic)
+            self.logger.info("Target audience: %s", target_audience or 'General')
+            self.logger.info("Tone: %s", tone)
+            self.logger.info(_EQ)
+            
+            # Serve identical requests from the result cache
+            content_key = _content_key(topic, target_audience, tone, exclude_keywords)
+            cached = cache_get(content_key)
+            if cached is not None:
+                self.logger.info("⚡ Serving cached article")
+                # Entries may be shared via the in-process tier
+                cached = dict(cached)
+                cached['execution_metadata'] = self._execution_metadata(
+                    start_time, topic, target_audience, tone, cache_hit=True
+                )
+                return cached
             
-            self.logger.info("✓ Crew assembled with 4 agents")
-            self.logger.info(f"  - Memory enabled: {settings.enable_memory}")
-            self.logger.info(f"  - Max iterations: {settings.max_iterations}")
+            # Finished stages of earlier runs stand in for their tasks
+            stage_keys = _stage_keys(topic, target_audience, tone, exclude_keywords)
+            cached_stages = _cached_stages(stage_keys)
+            
+            # Reuse the assembled crew for repeat inputs
+            crew, stages, crew_lock = _build_crew(
+                topic,
+                target_audience,
+                tone,
+                tuple(exclude_keywords or ()),
+                skip_stages=tuple(cached_stages),
+                memory_scope_id=memory_scope_id
+            )
+            if crew.memory:
+                # Crews in one scope share a memory namespace, so any of
+                # them can reset it later
+                self._scoped_crews[memory_scope_id] = _CrewEntry(crew, stages, crew_lock)
+            
+            self.logger.info("  - Memory enabled: %s", bool(crew.memory))
+            self.logger.info(
+                "  - Max iterations: researcher=%s strategist=%s writer=%s editor=%s",
+                settings.researcher_max_iter,
+                settings.strategist_max_iter,
+                settings.writer_max_iter,
+                settings.editor_max_iter
+            )
             self.logger.info("")
             
             # Execute the crew workflow
             self.logger.info("🚀 Executing crew workflow...")
-            self.logger.info("-" * 60)
+            self.logger.info(_DASH)
             
-            result = crew.kickoff()
+            # A Crew holds per-run state (task outputs, usage metrics),
+            # so concurrent runs of the same cached crew take turns
+            with crew_lock:
+                _restore_stages(stages, cached_stages)
+                try:
+                    result = crew.kickoff()
+                finally:
+                    _checkpoint_stages(stages, stage_keys, cached_stages)
+                
+                stage_timings = self._stage_timings(crew, stages)
             
-            self.logger.info("-" * 60)
+            self.logger.info(_DASH)
             self.logger.info("✓ Crew workflow completed")
             
             # Parse the final output from the editor
-            output = self._parse_output(result)
+            output = self._parse_output(result, exclude_keywords)
             
-            # Calculate execution time
-            execution_time = time.time() - start_time
-            self.logger.info(f"⏱️  Total execution time: {execution_time:.2f} seconds")
+            if output.get('status') == 'success':
+                # Cache a copy, since execution_metadata below is per run
+                cache_put(content_key, dict(output))
             
             # Add execution metadata
-            output['execution_metadata'] = {
+            output['execution_metadata'] = self._execution_metadata(
+                start_time, topic, target_audience, tone,
+                stage_timings=stage_timings
+            )
+            self.logger.info(
+                "⏱️  Total execution time: %.2f seconds",
+                output['execution_metadata']['execution_time_seconds']
+            )
+            
+            self.logger.info(_EQ)
+            self.logger.info("✅ Content generation completed successfully!")
+            self.logger.info(_EQ)
+            
+            return output
+            
+        except Exception as e:
+            return self._run_failed(e, start_time, topic)
+    
+    def _run_failed(
+        self,
+        error: Exception,
+        start_time: float,
+        topic: str
+    ) -> Dict[str, Any]:
+        """Build the error response for a run that raised."""
+        execution_time = time.perf_counter() - start_time
+        error_message = str(error)
+        
+        self.logger.error(_EQ)
+        self.logger.error("❌ Content generation failed: %s", error_message)
+        self.logger.error("⏱️  Failed after: %.2f seconds", execution_time)
+        self.logger.error(_EQ)
+        
+        return {
+            "status": "error",
+            "message": error_message,
+            "execution_metadata": {
                 'execution_time_seconds': round(execution_time, 2),
                 'topic': topic,
-                'target_audience': target_audience,
-                'tone': tone,
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
+                'error': error_message,
+                'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds')
+            }
+        }
+    
+    def _invalid_request(
+        self,
+        error: ValidationError,
+        start_time: float,
+        topic: str
+    ) -> Dict[str, Any]:
+        """Build the error response for inputs that fail validation."""
+        error_message = "; ".join(
+            f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in error.errors()
+        )
+        self.logger.error("❌ Invalid generation request: %s", error_message)
+        
+        return {
+            "status": "error",
+            "message": f"Invalid request: {error_message}",
+            "execution_metadata": {
+                'execution_time_seconds': round(time.perf_counter() - start_time, 2),
+                'topic': topic,
+                'error': error_message,
+                'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds')
             }
+        }
+    
+    @staticmethod
+    def _execution_metadata(
+        start_time: float,
+        topic: str,
+        target_audience: Optional[str],
+        tone: str,
+        cache_hit: bool = False,
+        stage_timings: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """Build the execution_metadata block for a finished run."""
+        return {
+            'execution_time_seconds': round(time.perf_counter() - start_time, 2),
+            'stage_timings': stage_timings,
+            'topic': topic,
+            'target_audience': target_audience,
+            'tone': tone,
+            'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds'),
+            'cache_hit': cache_hit
+        }
+    
+    @staticmethod
+    def _stage_timings(crew: "Crew", stages: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Collect per-stage durations from the last run of a crew.
+        
+        Stages left out of the crew (e.g. research served from the cache)
+        are omitted. Research and strategy overlap when run concurrently,
+        so the durations can add up to more than the total time.
+        """
+        ran = {id(task) for task in crew.tasks}
+        return {
+            name: round(task.execution_duration, 2)
+            for name, task in stages.items()
+            if id(task) in ran and task.execution_duration is not None
+        }
+    
+    async def agenerate_content(
+        self,
+        topic: str,
+        target_audience: Optional[str] = None,
+        tone: str = "professional",
+        exclude_keywords: Optional[List[str]] = None,
+        memory_scope_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of generate_content() for use inside a running event loop.
+        
+        The crew runs in a worker thread (as Crew.kickoff_async does), so the
+        event loop keeps serving other requests while the agents work.
+        
+        Args:
+            topic: The blog topic to write about (required)
+            target_audience: Optional target audience specification
+            tone: Writing tone (professional, casual, technical, conversational)
+            exclude_keywords: Optional list of keywords/phrases to avoid
+            memory_scope_id: Optional namespace for crew memory
             
-            self.logger.info("=" * 60)
-            self.logger.info("✅ Content generation completed successfully!")
-            self.logger.info("=" * 60)
+        Returns:
+            Dictionary with generated content, metadata, and sources
             
-            return output
+        Example:
+            >>> crew = ContentGenerationCrew()
+            >>> result = await crew.agenerate_content(topic="Edge AI in 2026")
+        """
+        return await asyncio.to_thread(
+            self.generate_content,
+            topic,
+            target_audience,
+            tone,
+            exclude_keywords,
+            memory_scope_id
+        )
+    
+    async def generate_content_stream(
+        self,
+        topic: str,
+        target_audience: Optional[str] = None,
+        tone: str = "professional",
+        exclude_keywords: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the workflow and stream the editor's output as it is generated.
+        
+        Yields a "metadata" event once the SEO metadata is complete,
+        "content" events with markdown body deltas, and a final "done"
+        event carrying the same dictionary generate_content() returns.
+        
+        Args:
+            topic: The blog topic to write about (required)
+            target_audience: Optional target audience specification
+            tone: Writing tone (professional, casual, technical, conversational)
+            exclude_keywords: Optional list of keywords/phrases to avoid
+            
+        Yields:
+            {"event": "metadata" | "content" | "done", "data": ...} dicts
+            
+        Example:
+            >>> crew = ContentGenerationCrew()
+            >>> async for event in crew.generate_content_stream("Edge AI in 2026"):
+            ...     print(event["event"])
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            request = ContentGenerationRequest(
+                topic=topic,
+                target_audience=target_audience,
+                tone=tone,
+                exclude_keywords=exclude_keywords
+            )
+        except ValidationError as e:
+            yield {"event": "done", "data": self._invalid_request(e, start_time, topic)}
+            return
+        
+        topic = request.topic
+        target_audience = request.target_audience
+        tone = request.tone
+        exclude_keywords = request.exclude_keywords
+        
+        try:
+            content_key = _content_key(topic, target_audience, tone, exclude_keywords)
+            cached = cache_get(content_key)
+            if cached is not None:
+                self.logger.info("⚡ Serving cached article")
+                cached = dict(cached)
+                cached['execution_metadata'] = self._execution_metadata(
+                    start_time, topic, target_audience, tone, cache_hit=True
+                )
+                yield {"event": "done", "data": cached}
+                return
+            
+            stage_keys = _stage_keys(topic, target_audience, tone, exclude_keywords)
+            cached_stages = _cached_stages(stage_keys)
+            
+            crew, stages, crew_lock = _build_crew(
+                topic,
+                target_audience,
+                tone,
+                tuple(exclude_keywords or ()),
+                skip_stages=tuple(cached_stages)
+            )
+            editing_index = len(crew.tasks) - 1
+            parser = _EditorStreamParser()
+            
+            await _acquire_crew_lock(crew_lock)
+            try:
+                _restore_stages(stages, cached_stages)
+                crew.stream = True
+                self.logger.info("🚀 Executing crew workflow (streaming)...")
+                try:
+                    with _private_llms(crew):
+                        streaming = await crew.kickoff_async()
+                        
+                        async for chunk in streaming:
+                            if chunk.task_index == editing_index:
+                                for event in parser.feed(chunk.content):
+                                    yield event
+                        
+                        result = streaming.result
+                finally:
+                    _checkpoint_stages(stages, stage_keys, cached_stages)
+                
+                stage_timings = self._stage_timings(crew, stages)
+            finally:
+                crew.stream = False
+                crew_lock.release()
+            
+            output = self._parse_output(result, exclude_keywords)
+            if output.get('status') == 'success':
+                # Cache a copy, since execution_metadata below is per run
+                cache_put(content_key, dict(output))
+            
+            output['execution_metadata'] = self._execution_metadata(
+                start_time, topic, target_audience, tone,
+                stage_timings=stage_timings
+            )
+            self.logger.info("✅ Streamed content generation completed")
+            yield {"event": "done", "data": output}
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            error_message = str(e)
+            yield {"event": "done", "data": self._run_failed(e, start_time, topic)}
+    
+    async def generate_many(
+        self,
+        topics: List[str],
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate content for several topics concurrently.
+        
+        At most max_concurrency crews run at once so parallel runs stay
+        within the provider's rate limits.
+        
+        Args:
+            topics: Blog topics to write about
+            max_concurrency: Parallel run limit (defaults to
+                             settings.max_concurrent_generations)
+            **kwargs: target_audience, tone and exclude_keywords, applied
+                      to every topic
             
-            self.logger.error("=" * 60)
-            self.logger.error(f"❌ Content generation failed: {error_message}")
-            self.logger.error(f"⏱️  Failed after: {execution_time:.2f} seconds")
-            self.logger.error("=" * 60)
+        Returns:
+            One result dictionary per topic, in input order
             
-            return {
-                "status": "error",
-                "message": error_message,
-                "execution_metadata": {
-                    'execution_time_seconds': round(execution_time, 2),
-                    'topic': topic,
-                    'error': error_message,
-                    'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
-                }
-            }
+        Example:
+            >>> crew = ContentGenerationCrew()
+            >>> results = await crew.generate_many(
+            ...     ["Edge AI in 2026", "RAG vs fine-tuning"],
+            ...     tone="technical"
+            ... )
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrency or settings.max_concurrent_generations
+        )
+        
+        async def run(topic: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.agenerate_content(topic, **kwargs)
+        
+        return await asyncio.gather(*(run(topic) for topic in topics))
+    
+    def clear_memory(self, memory_scope_id: str) -> bool:
+        """
+        Delete the crew memory stored under one scope.
+        
+        Only scopes used by this instance since startup can be cleared.
+        
+        Args:
+            memory_scope_id: Scope passed to generate_content()
+            
+        Returns:
+            True if a memory store was reset, False if the scope is unknown
+            
+        Example:
+            >>> crew = ContentGenerationCrew()
+            >>> crew.clear_memory("tenant-42")
+            False
+        """
+        entry = self._scoped_crews.pop(memory_scope_id, None)
+        if entry is None:
+            return False
+        
+        # Crew.reset_memories() wipes the whole backing store, every scope
+        # included; the crew's own Memory resets only under its root scope
+        # (/crew/blog-brain-<scope>)
+        with entry.lock:
+            if entry.crew._memory is not None:
+                entry.crew._memory.reset()
+        
+        self.logger.info("🧹 Cleared crew memory for scope '%s'", memory_scope_id)
+        return True
     
-    def _parse_output(self, result: Any) -> Dict[str, Any]:
+    def _parse_output(
+        self,
+        result: Any,
+        exclude_keywords: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Parse the crew output into a standardized format.
         
         The editor agent returns JSON wrapped in markdown code blocks.
-        We need to extract and parse this JSON properly.
+        The output shape is detected up front and handled in one pass:
+        structured output is used as-is, text goes through a single JSON
+        parse, and anything unparseable is wrapped as plain markdown.
         
         Args:
             result: Output from crew.kickoff()
+            exclude_keywords: Keywords the article must not contain
             
         Returns:
             Standardized dictionary with content and metadata
         """
         
         self.logger.info("Parsing crew output...")
+        self.logger.debug("Raw output type: %s", type(result))
         
-        # CrewAI returns a result object with raw string output
-        raw_output = str(result)
+        parsed_data, raw_output = _split_result(result)
         
-        self.logger.info(f"Raw output type: {type(result)}")
+        if parsed_data is not None:
+            self.logger.info("✓ Using structured crew output")
+        else:
+            parsed_data = self._extract_json(raw_output)
         
-        try:
-            # The editor returns JSON wrapped in ```json code blocks
-            # Extract JSON from code blocks
-            if "```json" in raw_output:
-                self.logger.info("Extracting JSON from code block...")
-                start_idx = raw_output.find("```json") + 7
-                end_idx = raw_output.find("```", start_idx)
-                json_str = raw_output[start_idx:end_idx].strip()
-                
-                # Parse the JSON
-                parsed_data = json.loads(json_str)
-                self.logger.info("✓ Successfully extracted and parsed JSON from code block")
-                
-                # The editor returns the data directly, wrap it in success response
-                return {
-                    "status": "success",
-                    "data": {
-                        "metadata": parsed_data.get("metadata", {}),
-                        "content": parsed_data.get("content", {}),
-                        "sources": parsed_data.get("sources", []),
-                        "quality_checks": parsed_data.get("quality_checks"),
-                        "editor_notes": parsed_data.get("editor_notes")
-                    }
-                }
-            
-            # Try parsing as direct JSON
-            try:
-                parsed_data = json.loads(raw_output)
-                self.logger.info("✓ Successfully parsed direct JSON")
-                
-                # Check if it's already in the correct format
-                if "status" in parsed_data and "data" in parsed_data:
-                    return parsed_data
-                
-                # Wrap it in success response
-                return {
-                    "status": "success",
-                    "data": {
-                        "metadata": parsed_data.get("metadata", {}),
-                        "content": parsed_data.get("content", {}),
-                        "sources": parsed_data.get("sources", []),
-                        "quality_checks": parsed_data.get("quality_checks"),
-                        "editor_notes": parsed_data.get("editor_notes")
-                    }
+        if parsed_data is None:
+            self.logger.warning("⚠️  Could not parse as JSON, treating as plain text")
+            parsed_data = _plain_text_output(raw_output)
+        
+        # Check if it's already in the correct format
+        if "status" in parsed_data and "data" in parsed_data:
+            if parsed_data["status"] != "success":
+                return parsed_data
+            parsed_data = parsed_data["data"]
+        
+        # The editor sends a draft back instead of approving it
+        if parsed_data.get("status") == "rejected":
+            reason = parsed_data.get("reason", "no reason given")
+            self.logger.error("❌ Editor rejected the draft: %s", reason)
+            return {
+                "status": "error",
+                "message": f"Editor rejected the draft: {reason}",
+                "data": {
+                    "required_changes": parsed_data.get("required_changes", []),
+                    "raw_output": raw_output
                 }
-                
-            except json.JSONDecodeError:
-                self.logger.warning("⚠️  Could not parse as JSON, treating as plain text")
-                
-                # Fallback: wrap raw text
-                return {
-                    "status": "success",
-                    "data": {
-                        "metadata": {
-                            "seo_title": "Generated Content",
-                            "meta_description": "AI-generated content",
-                            "slug": "generated-content",
-                            "focus_keyword": "content",
-                            "estimated_read_time": "5 mins",
-                            "word_count": len(raw_output.split())
-                        },
-                        "content": {
-                            "markdown_body": raw_output,
-                            "html_body": f"<p>{raw_output}</p>"
-                        },
-                        "sources": []
-                    }
+            }
+        
+        # The editor returns the data directly, wrap it in success response
+        try:
+            data = EditorOutput.model_validate(parsed_data)
+        except ValidationError as e:
+            self.logger.error("❌ Error parsing output: %s", e)
+            return {
+                "status": "error",
+                "message": f"Failed to parse editor output: {e}",
+                "data": {
+                    "raw_output": raw_output
                 }
-                
-        except Exception as e:
-            self.logger.error(f"❌ Error parsing output: {str(e)}")
+            }
+        
+        output = data.model_dump(exclude_none=True)
+        
+        # HTML is rendered here rather than by the editor, which would
+        # otherwise write the whole article out a second time
+        markdown = output["content"].get("markdown_body")
+        if isinstance(markdown, str):
+            output["content"]["html_body"] = markdown_to_html(markdown)
+        
+        self._check_phrases(output, exclude_keywords)
+        if settings.verify_source_links:
+            self._check_sources(output)
+        
+        # Only output that satisfies the API response model counts as success
+        try:
+            content = ContentDataResponse.model_validate(output)
+        except ValidationError as e:
+            self.logger.error("❌ Editor output is incomplete: %s", e)
             return {
                 "status": "error",
-                "message": f"Failed to parse editor output: {str(e)}",
+                "message": f"Editor output is missing required fields: {e}",
                 "data": {
                     "raw_output": raw_output
                 }
             }
-
+        
+        return {
+            "status": "success",
+            "data": content.model_dump(exclude_none=True)
+        }
+    
+    def _check_phrases(
+        self,
+        data: Dict[str, Any],
+        exclude_keywords: Optional[List[str]] = None
+    ) -> None:
+        """
+        Verify the final article's readability, banned phrases and excluded keywords.
+        
+        Corrects the editor's ai_isms_removed and readability_score claims and
+        records any excluded keywords that slipped through in quality_checks.
+        
+        Args:
+            data: Editor output; quality_checks is updated in place
+            exclude_keywords: Keywords the request asked to avoid
+        """
+        
+        markdown = data.get("content", {}).get("markdown_body")
+        if not isinstance(markdown, str):
+            return
+        
+        quality_checks = data.get("quality_checks")
+        if quality_checks is not None:
+            # Measured Lix replaces the editor's self-reported readability
+            lix = lix_score(markdown)
+            quality_checks["readability_lix"] = round(lix, 1)
+            quality_checks["readability_score"] = readability_bucket(lix)
+        
+        ai_isms = sorted({phrase for _, phrase in find_ai_isms(markdown)})
+        if ai_isms:
+            self.logger.warning("⚠️  AI-isms left in article: %s", ", ".join(ai_isms))
+            if quality_checks is not None:
+                quality_checks["ai_isms_removed"] = False
+        
+        excluded = sorted({
+            phrase for _, phrase in find_phrases(markdown, tuple(exclude_keywords or ()))
+        })
+        if excluded:
+            self.logger.warning("⚠️  Excluded keywords used in article: %s", ", ".join(excluded))
+            if quality_checks is not None:
+                quality_checks["excluded_keywords_found"] = excluded
+    
+    def _check_sources(self, data: Dict[str, Any]) -> None:
+        """
+        Verify that the article's cited source URLs still resolve.
+        
+        Links are checked concurrently; any that are unreachable or return
+        an error status are recorded in quality_checks["broken_sources"].
+        
+        Args:
+            data: Editor output; quality_checks is updated in place
+        """
+        
+        urls = [
+            source for source in data.get("sources", [])
+            if isinstance(source, str) and source.startswith(("http://", "https://"))
+        ]
+        if not urls:
+            return
+        
+        statuses = check_urls(urls, timeout=settings.link_check_timeout)
+        broken = [url for url, status in statuses.items() if status is None or status >= 400]
+        if broken:
+            self.logger.warning("⚠️  %d of %d sources unreachable: %s", len(broken), len(statuses), ", ".join(broken))
+            quality_checks = data.get("quality_checks")
+            if quality_checks is not None:
+                quality_checks["broken_sources"] = broken
+    
+    def _extract_json(self, raw_output: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the editor's JSON from raw text output.
+        
+        Args:
+            raw_output: Raw text returned by the editor
+            
+        Returns:
+            Parsed editor data, or None when the text holds no valid JSON
+        """
+        
+        # The editor returns JSON wrapped in ```json code blocks
+        fenced = _JSON_FENCE.search(raw_output)
+        match = fenced or _BRACE_SPAN.search(raw_output)
+        if match is None:
+            return None
+        
+        try:
+            parsed_data = orjson.loads(match.group(1) if fenced else match.group(0))
+        except json.JSONDecodeError:
+            return None
+        
+        if fenced:
+            self.logger.info("✓ Successfully extracted and parsed JSON from code block")
+        else:
+            self.logger.info("✓ Successfully parsed direct JSON")
+        return parsed_data
     
     def validate_output(self, output: Dict[str, Any]) -> bool:
         """
@@ -293,7 +1129,7 @@ class ContentGenerationCrew:
         
         for field in required_fields:
             if field not in output:
-                self.logger.error(f"❌ Missing required field: {field}")
+                self.logger.error("❌ Missing required field: %s", field)
                 return False
         
         if output['status'] == 'success':
@@ -327,9 +1163,9 @@ if __name__ == "__main__":
     - All dependencies installed
     """
     
-    print("\n" + "=" * 60)
+    print("\n" + _EQ)
     print("Content Generation Crew - Example Usage")
-    print("=" * 60 + "\n")
+    print(_EQ + "\n")
     
     # Create crew instance
     crew = ContentGenerationCrew()
@@ -351,4 +1187,4 @@ if __name__ == "__main__":
     print("# )")
     print("# print(json.dumps(result, indent=2))")
     print()
-    print("=" * 60)
+    print(_EQ)
@@ -4,30 +4,60 @@ Blog Brain - FastAPI Server
 Main application entry point for the Blog Brain content generation API.
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from schemas.request_schema import ContentGenerationRequest, HealthCheckResponse
 from schemas.response_schema import (
     ContentGenerationSuccessResponse,
     ContentGenerationErrorResponse
 )
 from crew import ContentGenerationCrew
+from agents import acreate_all_agents
 from config import settings
 from utils.logger import setup_logger
+import asyncio
+import orjson
 import time
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
 
 # Initialize logger
 logger = setup_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up agents on startup and release crew threads on shutdown."""
+    logger.info(
+        "🚀 Blog Brain API starting: version=1.0.0 model=%s origins=%s",
+        settings.gemini_model,
+        settings.allowed_origins
+    )
+    
+    # Build all agents up front so the first request sees no construction latency
+    try:
+        await acreate_all_agents()
+    except Exception as e:
+        logger.warning(f"⚠️  Agent warmup failed, agents will be built on first request: {str(e)}")
+    
+    yield
+    
+    logger.info("🛑 Blog Brain API shutting down")
+    crew_executor.shutdown(wait=False, cancel_futures=True)
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Blog Brain API",
     description="AI-powered content generation system using multi-agent CrewAI architecture",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc"
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url="/redoc" if settings.enable_docs else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS middleware
@@ -39,27 +69,50 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress article responses (HTML + Markdown bodies compress several-fold)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize crew instance
 crew_instance = ContentGenerationCrew()
 
+# Dedicated threads for blocking crew runs, so generations never starve the
+# default executor and never block the event loop
+crew_executor = ThreadPoolExecutor(
+    max_workers=settings.max_concurrent_generations,
+    thread_name_prefix="crew"
+)
 
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info("=" * 60)
-    logger.info("🚀 Blog Brain API Starting...")
-    logger.info(f"   Version: 1.0.0")
-    logger.info(f"   Environment: {settings.gemini_model}")
-    logger.info(f"   CORS Origins: {settings.allowed_origins}")
-    logger.info("=" * 60)
+# Generations admitted at once (running plus waiting for a crew thread);
+# anything beyond is turned away with 429 instead of queueing unbounded
+generation_slots = asyncio.Semaphore(
+    settings.max_concurrent_generations + settings.max_queued_generations
+)
+
+# Static payloads, serialized once instead of on every request
+_ROOT_BYTES = orjson.dumps({
+    "service": "Blog Brain API",
+    "version": "1.0.0",
+    "description": "AI-powered content generation system",
+    "documentation": "/docs",
+    "endpoints": {
+        "health": "/health",
+        "generate": "/api/v1/generate-post"
+    }
+})
+_HEALTH_BYTES = orjson.dumps(HealthCheckResponse(
+    status="healthy",
+    service="Blog Brain API",
+    version="1.0.0"
+).model_dump())
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    logger.info("=" * 60)
-    logger.info("🛑 Blog Brain API Shutting Down...")
-    logger.info("=" * 60)
+@app.middleware("http")
+async def add_elapsed_header(request: Request, call_next):
+    """Report server-side handling time in the X-Elapsed-ms header."""
+    start_time = time.perf_counter()
+    response = await call_next(request)
+    response.headers["X-Elapsed-ms"] = f"{(time.perf_counter() - start_time) * 1000:.1f}"
+    return response
 
 
 @app.get("/", tags=["Root"])
@@ -69,16 +122,7 @@ async def root():
     
     Returns basic information about the API.
     """
-    return {
-        "service": "Blog Brain API",
-        "version": "1.0.0",
-        "description": "AI-powered content generation system",
-        "documentation": "/docs",
-        "endpoints": {
-            "health": "/health",
-            "generate": "/api/v1/generate-post"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get(
@@ -92,23 +136,24 @@ async def health_check():
     
     Returns the current health status of the API.
     """
-    return HealthCheckResponse(
-        status="healthy",
-        service="Blog Brain API",
-        version="1.0.0"
-    )
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.post(
     "/api/v1/generate-post",
-    response_model=Union[ContentGenerationSuccessResponse, ContentGenerationErrorResponse],
+    response_model=None,
+    responses={
+        200: {"model": ContentGenerationSuccessResponse},
+        429: {"model": ContentGenerationErrorResponse},
+        500: {"model": ContentGenerationErrorResponse}
+    },
     tags=["Content Generation"],
     summary="Generate blog post",
     description="Generate a complete, SEO-optimized blog post using AI agents"
 )
 async def generate_post(
     request: ContentGenerationRequest
-) -> Union[ContentGenerationSuccessResponse, ContentGenerationErrorResponse]:
+) -> ORJSONResponse:
     """
     Generate a complete blog post.
     
@@ -122,11 +167,14 @@ async def generate_post(
         request: ContentGenerationRequest with topic and parameters
         
     Returns:
-        ContentGenerationSuccessResponse with generated content and metadata
-        or ContentGenerationErrorResponse if generation fails
+        ContentGenerationSuccessResponse body with generated content and
+        metadata, or a 500 ContentGenerationErrorResponse body if generation
+        fails. The crew only reports success for editor output that passes
+        ContentDataResponse validation, so the result is sent as-is.
         
     Raises:
-        HTTPException: For validation errors or server errors
+        HTTPException: For validation errors, server errors, or 429 when
+            every generation slot is taken
         
     Example:
         POST /api/v1/generate-post
@@ -137,45 +185,57 @@ async def generate_post(
         }
     """
     
-    start_time = time.time()
+    start_time = time.perf_counter()
+    
+    if generation_slots.locked():
+        logger.warning("🚦 Generation rejected: all slots busy, topic=%r", request.topic)
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "status": "error",
+                "message": "Server is busy generating other posts, retry shortly"
+            },
+            headers={"Retry-After": "30"}
+        )
     
     try:
-        logger.info("=" * 60)
-        logger.info(f"📝 New content generation request")
-        logger.info(f"   Topic: {request.topic}")
-        logger.info(f"   Audience: {request.target_audience or 'General'}")
-        logger.info(f"   Tone: {request.tone}")
-        logger.info("=" * 60)
-        
-        # Generate content using the crew
-        result = crew_instance.generate_content(
-            topic=request.topic,
-            target_audience=request.target_audience,
-            tone=request.tone,
-            exclude_keywords=request.exclude_keywords
+        logger.info(
+            "📝 Generation request: topic=%r audience=%r tone=%s",
+            request.topic,
+            request.target_audience or 'General',
+            request.tone
         )
         
-        execution_time = time.time() - start_time
+        # Generate content using the crew (in a worker thread so the
+        # event loop keeps serving other requests)
+        loop = asyncio.get_running_loop()
+        async with generation_slots:
+            result = await loop.run_in_executor(crew_executor, partial(
+                crew_instance.generate_content,
+                topic=request.topic,
+                target_audience=request.target_audience,
+                tone=request.tone,
+                exclude_keywords=request.exclude_keywords
+            ))
         
         # Check if generation was successful
         if result.get('status') == 'success':
-            logger.info("=" * 60)
-            logger.info(f"✅ Content generation successful")
-            logger.info(f"   Execution time: {execution_time:.2f}s")
-            logger.info("=" * 60)
-            return result
+            logger.info("✅ Generation succeeded: topic=%r", request.topic)
+            return ORJSONResponse(content=result)
         else:
             # Generation failed
-            logger.error("=" * 60)
-            logger.error(f"❌ Content generation failed")
-            logger.error(f"   Error: {result.get('message', 'Unknown error')}")
-            logger.error(f"   Execution time: {execution_time:.2f}s")
-            logger.error("=" * 60)
+            logger.error(
+                "❌ Generation failed: error=%s",
+                result.get('message', 'Unknown error')
+            )
             
-            return ContentGenerationErrorResponse(
-                status="error",
-                message=result.get('message', 'Content generation failed'),
-                execution_metadata=result.get('execution_metadata')
+            return ORJSONResponse(
+                status_code=500,
+                content={
+                    "status": "error",
+                    "message": result.get('message', 'Content generation failed'),
+                    "execution_metadata": result.get('execution_metadata')
+                }
             )
     
     except ValueError as e:
@@ -192,11 +252,8 @@ async def generate_post(
     
     except Exception as e:
         # Unexpected server error
-        execution_time = time.time() - start_time
-        logger.error("=" * 60)
-        logger.error(f"❌ Unexpected server error: {str(e)}")
-        logger.error(f"   Execution time: {execution_time:.2f}s")
-        logger.error("=" * 60)
+        execution_time = time.perf_counter() - start_time
+        logger.error("❌ Unexpected server error: error=%s", e)
         
         raise HTTPException(
             status_code=500,
@@ -212,9 +269,10 @@ async def generate_post(
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Custom HTTP exception handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
-        content=exc.detail
+        content=exc.detail,
+        headers=exc.headers
     )
 
 
@@ -222,7 +280,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 async def general_exception_handler(request: Request, exc: Exception):
     """General exception handler for unhandled errors."""
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "status": "error",
@@ -234,20 +292,39 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 # Run the application
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     
+    # uvloop/httptools ship with uvicorn[standard]; uvloop has no Windows build
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    
+    # Each worker is a separate process with its own crew, rate limiter and
+    # thread pool; reload mode only supports a single process
+    workers = 1 if settings.api_reload else settings.api_workers
+    
+    # Reload and multi-worker modes re-import the app from its import string;
+    # a single worker serves this already-imported app instead of importing
+    # main a second time
+    target = app if workers == 1 and not settings.api_reload else "main:app"
+    
     logger.info("\n" + "=" * 60)
     logger.info("Starting Blog Brain API Server")
     logger.info(f"Host: {settings.api_host}")
     logger.info(f"Port: {settings.api_port}")
-    logger.info(f"Reload: {settings.api_reload}")
+    logger.info(f"Reload: {settings.api_reload}, Workers: {workers}")
+    logger.info(f"Event loop: {loop}, HTTP parser: {http}")
     logger.info(f"Docs: http://{settings.api_host}:{settings.api_port}/docs")
     logger.info("=" * 60 + "\n")
     
     uvicorn.run(
-        "main:app",
+        target,
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
-        log_level=settings.log_level.lower()
+        workers=workers,
+        log_level=settings.log_level.lower(),
+        loop=loop,
+        http=http,
+        access_log=False  # X-Elapsed-ms header replaces per-request access lines
     )
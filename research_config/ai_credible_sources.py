@@ -16,7 +16,10 @@ Usage:
     academic_sources = AI_CREDIBLE_SOURCES['academic']
 """
 
-from typing import Dict, List
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 # AI Credible Sources organized by category
 AI_CREDIBLE_SOURCES: Dict[str, List[str]] = {
@@ -161,17 +164,40 @@ TARGET_SOURCE_DISTRIBUTION: Dict[str, float] = {
 }
 
 
-def get_all_domains() -> List[str]:
+# Every listed domain, in category order
+_ALL_DOMAINS: Tuple[str, ...] = tuple(
+    domain for domains in AI_CREDIBLE_SOURCES.values() for domain in domains
+)
+
+# Flattened domain -> (category, priority) lookup; the first category listing
+# a domain wins, matching the order of AI_CREDIBLE_SOURCES
+_DOMAIN_INDEX: Dict[str, Tuple[str, float]] = {}
+for _category, _domains in AI_CREDIBLE_SOURCES.items():
+    for _domain in _domains:
+        _DOMAIN_INDEX.setdefault(_domain.lower(), (_category, SOURCE_PRIORITY[_category]))
+
+# Substring matchers for the fallback path: one regex alternation finds a
+# listed domain inside the input, and one find() over the newline-joined
+# names finds the input inside a listed domain
+_DOMAIN_NAMES: List[str] = list(_DOMAIN_INDEX)
+_DOMAIN_PATTERN = re.compile("|".join(map(re.escape, _DOMAIN_NAMES)))
+_DOMAIN_BLOB = "\n".join(_DOMAIN_NAMES)
+_DOMAIN_OFFSETS: List[int] = []
+_offset = 0
+for _name in _DOMAIN_NAMES:
+    _DOMAIN_OFFSETS.append(_offset)
+    _offset += len(_name) + 1
+_DOMAIN_ORDER: Dict[str, int] = {name: i for i, name in enumerate(_DOMAIN_NAMES)}
+
+
+def get_all_domains() -> Tuple[str, ...]:
     """
     Get a flat list of all credible AI domains.
     
     Returns:
-        List of all domain strings across all categories
+        Shared tuple of all domain strings across all categories
     """
-    all_domains = []
-    for domains in AI_CREDIBLE_SOURCES.values():
-        all_domains.extend(domains)
-    return all_domains
+    return _ALL_DOMAINS
 
 
 def get_category_for_domain(domain: str) -> str:
@@ -184,12 +210,7 @@ def get_category_for_domain(domain: str) -> str:
     Returns:
         Category name or empty string if not found
     """
-    domain = domain.lower()
-    for category, domains in AI_CREDIBLE_SOURCES.items():
-        for credible_domain in domains:
-            if credible_domain.lower() in domain or domain in credible_domain.lower():
-                return category
-    return ""
+    return _lookup_domain(domain.lower())[0]
 
 
 def get_priority_for_domain(domain: str) -> float:
@@ -202,8 +223,42 @@ def get_priority_for_domain(domain: str) -> float:
     Returns:
         Priority score (0.0-1.0), or 0.3 if unknown domain
     """
-    category = get_category_for_domain(domain)
-    return SOURCE_PRIORITY.get(category, 0.3)
+    return _lookup_domain(domain.lower())[1]
+
+
+@lru_cache(maxsize=1024)
+def _lookup_domain(domain: str) -> Tuple[str, float]:
+    """
+    Resolve a lower-cased domain to its (category, priority).
+    
+    Exact and parent-domain matches (www.arxiv.org -> arxiv.org) are dict
+    hits; anything else falls back to the precompiled substring matchers.
+    
+    Args:
+        domain: Lower-cased domain string
+        
+    Returns:
+        (category, priority) tuple, or ("", 0.3) if unknown domain
+    """
+    labels = domain.split(".")
+    for i in range(len(labels) - 1):
+        hit = _DOMAIN_INDEX.get(".".join(labels[i:]))
+        if hit is not None:
+            return hit
+    
+    # Earliest-listed match wins, whichever direction it matched in
+    candidates = []
+    match = _DOMAIN_PATTERN.search(domain)
+    if match:
+        candidates.append(_DOMAIN_ORDER[match.group()])
+    if "\n" not in domain:
+        pos = _DOMAIN_BLOB.find(domain)
+        if pos >= 0:
+            candidates.append(bisect_right(_DOMAIN_OFFSETS, pos) - 1)
+    
+    if candidates:
+        return _DOMAIN_INDEX[_DOMAIN_NAMES[min(candidates)]]
+    return ("", 0.3)
 
 
 # Example usage
@@ -7,7 +7,8 @@ Contains Pydantic models for request validation and response formatting.
 # Request schemas
 from schemas.request_schema import (
     ContentGenerationRequest,
-    HealthCheckResponse
+    HealthCheckResponse,
+    Tone
 )
 
 # Response schemas
@@ -16,6 +17,7 @@ from schemas.response_schema import (
     ContentResponse,
     QualityChecksResponse,
     ContentDataResponse,
+    EditorOutput,
     ExecutionMetadataResponse,
     ContentGenerationSuccessResponse,
     ErrorDetail,
@@ -26,12 +28,14 @@ __all__ = [
     # Request models
     'ContentGenerationRequest',
     'HealthCheckResponse',
+    'Tone',
     
     # Response models
     'MetaDataResponse',
     'ContentResponse',
     'QualityChecksResponse',
     'ContentDataResponse',
+    'EditorOutput',
     'ExecutionMetadataResponse',
     'ContentGenerationSuccessResponse',
     'ErrorDetail',
@@ -5,8 +5,18 @@ Defines the structure and validation rules for API requests
 to the content generation endpoint.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List, Literal
+
+# Writing tones the agents are prompted for
+Tone = Literal[
+    "professional",
+    "casual",
+    "technical",
+    "conversational",
+    "formal",
+    "friendly"
+]
 
 
 class ContentGenerationRequest(BaseModel):
@@ -21,30 +31,27 @@ class ContentGenerationRequest(BaseModel):
         ...,
         min_length=5,
         max_length=200,
-        description="The blog topic to write about",
-        example="How AI is Transforming Customer Service in 2026"
+        description="The blog topic to write about"
     )
     
     target_audience: Optional[str] = Field(
         None,
         max_length=100,
-        description="Optional target audience specification",
-        example="Small business owners"
+        description="Optional target audience specification"
     )
     
-    tone: str = Field(
+    tone: Tone = Field(
         default="professional",
-        description="Writing tone for the article",
-        example="professional"
+        description="Writing tone for the article"
     )
     
     exclude_keywords: Optional[List[str]] = Field(
         default=None,
-        description="Optional list of keywords/phrases to avoid",
-        example=["game-changer", "revolutionary"]
+        description="Optional list of keywords/phrases to avoid"
     )
     
-    @validator('topic')
+    @field_validator('topic')
+    @classmethod
     def validate_topic(cls, v):
         """Validate topic field."""
         if not v or v.strip() == "":
@@ -55,51 +62,36 @@ class ContentGenerationRequest(BaseModel):
         
         return v
     
-    @validator('tone')
+    @field_validator('tone', mode='before')
+    @classmethod
     def validate_tone(cls, v):
-        """Validate tone field."""
-        allowed_tones = [
-            "professional",
-            "casual",
-            "technical",
-            "conversational",
-            "formal",
-            "friendly"
-        ]
-        
-        v_lower = v.lower()
-        if v_lower not in allowed_tones:
-            raise ValueError(
-                f"Tone must be one of: {', '.join(allowed_tones)}"
-            )
-        
-        return v_lower
+        """Lower-case the tone so the Literal check is case insensitive."""
+        if isinstance(v, str):
+            return v.lower()
+        return v
     
-    @validator('exclude_keywords')
+    @field_validator('exclude_keywords')
+    @classmethod
     def validate_exclude_keywords(cls, v):
         """Validate exclude_keywords field."""
         if v is None:
             return v
         
-        # Remove empty strings and duplicates
-        cleaned = list(set([kw.strip() for kw in v if kw.strip()]))
-        
         # Limit to 20 keywords
-        if len(cleaned) > 20:
+        if len(v) > 20:
             raise ValueError("Maximum 20 exclude keywords allowed")
         
-        return cleaned
+        # Remove empty strings and duplicates, keeping the caller's order
+        return list(dict.fromkeys(kw for kw in map(str.strip, v) if kw))
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "topic": "The Future of AI in Healthcare",
-                "target_audience": "Healthcare professionals",
-                "tone": "professional",
-                "exclude_keywords": ["game-changer", "revolutionary"]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "topic": "The Future of AI in Healthcare",
+            "target_audience": "Healthcare professionals",
+            "tone": "professional",
+            "exclude_keywords": ["game-changer", "revolutionary"]
         }
+    })
 
 
 class HealthCheckResponse(BaseModel):
@@ -109,28 +101,23 @@ class HealthCheckResponse(BaseModel):
     
     status: str = Field(
         ...,
-        description="Health status",
-        example="healthy"
+        description="Health status"
     )
     
     service: str = Field(
         ...,
-        description="Service name",
-        example="Blog Brain API"
+        description="Service name"
     )
     
     version: str = Field(
         ...,
-        description="API version",
-        example="1.0.0"
+        description="API version"
     )
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "status": "healthy",
-                "service": "Blog Brain API",
-                "version": "1.0.0"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "status": "healthy",
+            "service": "Blog Brain API",
+            "version": "1.0.0"
         }
+    })
@@ -4,7 +4,7 @@ API Response Schema - Pydantic Models
 Defines the structure for API responses from the content generation endpoint.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -14,45 +14,50 @@ class MetaDataResponse(BaseModel):
     
     seo_title: str = Field(
         ...,
-        description="SEO-optimized title (55-60 characters)",
-        example="How AI Transforms Customer Service: Complete 2026 Guide"
+        description="SEO-optimized title (55-60 characters)"
     )
     
     meta_description: str = Field(
         ...,
-        description="Meta description (150-160 characters)",
-        example="Discover how AI is revolutionizing customer service in 2026. Learn implementation strategies, ROI metrics, and best practices for businesses."
+        description="Meta description (150-160 characters)"
     )
     
     slug: str = Field(
         ...,
-        description="URL-friendly slug",
-        example="ai-customer-service-2026-guide"
+        description="URL-friendly slug"
     )
     
     focus_keyword: str = Field(
         ...,
-        description="Primary SEO keyword",
-        example="AI customer service"
+        description="Primary SEO keyword"
     )
     
     estimated_read_time: str = Field(
         ...,
-        description="Estimated reading time",
-        example="8 mins"
+        description="Estimated reading time"
     )
     
     word_count: int = Field(
         ...,
-        description="Total word count",
-        example=1850
+        description="Total word count"
     )
     
     published_date: Optional[str] = Field(
         None,
-        description="Publication date in ISO format",
-        example="2026-02-09T12:00:00"
-    )
+        description="Publication date in ISO format"
+    )
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "seo_title": "How AI Transforms Customer Service: Complete 2026 Guide",
+            "meta_description": "Discover how AI is revolutionizing customer service in 2026. Learn implementation strategies, ROI metrics, and best practices for businesses.",
+            "slug": "ai-customer-service-2026-guide",
+            "focus_keyword": "AI customer service",
+            "estimated_read_time": "8 mins",
+            "word_count": 1850,
+            "published_date": "2026-02-09T12:00:00"
+        }
+    })
 
 
 class ContentResponse(BaseModel):
@@ -60,15 +65,20 @@ class ContentResponse(BaseModel):
     
     html_body: str = Field(
         ...,
-        description="Full article in HTML format",
-        example="<h1>How AI Transforms Customer Service</h1><p>Introduction...</p>"
+        description="Full article in HTML format"
     )
     
     markdown_body: str = Field(
         ...,
-        description="Full article in Markdown format",
-        example="# How AI Transforms Customer Service\n\nIntroduction..."
+        description="Full article in Markdown format"
     )
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "html_body": "<h1>How AI Transforms Customer Service</h1><p>Introduction...</p>",
+            "markdown_body": "# How AI Transforms Customer Service\n\nIntroduction..."
+        }
+    })
 
 
 class QualityChecksResponse(BaseModel):
@@ -76,33 +86,53 @@ class QualityChecksResponse(BaseModel):
     
     ai_isms_removed: bool = Field(
         ...,
-        description="Whether AI-sounding phrases were removed",
-        example=True
+        description="Whether AI-sounding phrases were removed"
     )
     
     citations_count: int = Field(
         ...,
-        description="Number of citations/sources included",
-        example=12
+        description="Number of citations/sources included"
     )
     
     readability_score: str = Field(
         ...,
-        description="Overall readability assessment",
-        example="good"
+        description="Overall readability assessment"
+    )
+    
+    readability_lix: Optional[float] = Field(
+        None,
+        description="Lix readability index of the article (below 40 reads as good)"
     )
     
     seo_compliance: str = Field(
         ...,
-        description="SEO requirements compliance status",
-        example="passed"
+        description="SEO requirements compliance status"
     )
     
     human_sounding: bool = Field(
         ...,
-        description="Whether content sounds authentically human",
-        example=True
+        description="Whether content sounds authentically human"
+    )
+    
+    excluded_keywords_found: Optional[List[str]] = Field(
+        None,
+        description="Requested exclude_keywords that still appear in the article"
+    )
+    
+    broken_sources: Optional[List[str]] = Field(
+        None,
+        description="Cited source URLs that failed link verification"
     )
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "ai_isms_removed": True,
+            "citations_count": 12,
+            "readability_score": "good",
+            "seo_compliance": "passed",
+            "human_sounding": True
+        }
+    })
 
 
 class ContentDataResponse(BaseModel):
@@ -120,11 +150,7 @@ class ContentDataResponse(BaseModel):
     
     sources: List[str] = Field(
         ...,
-        description="List of source URLs cited in the article",
-        example=[
-            "https://example.com/ai-trends-2026",
-            "https://research.com/customer-service-study"
-        ]
+        description="List of source URLs cited in the article"
     )
     
     quality_checks: Optional[QualityChecksResponse] = Field(
@@ -134,9 +160,53 @@ class ContentDataResponse(BaseModel):
     
     editor_notes: Optional[str] = Field(
         None,
-        description="Notes from the editorial review",
-        example="Excellent article with strong citations"
-    )
+        description="Notes from the editorial review"
+    )
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "metadata": {
+                "seo_title": "How AI Transforms Customer Service: Complete 2026 Guide",
+                "meta_description": "Discover how AI is revolutionizing customer service in 2026. Learn implementation strategies, ROI metrics, and best practices for businesses.",
+                "slug": "ai-customer-service-2026-guide",
+                "focus_keyword": "AI customer service",
+                "estimated_read_time": "8 mins",
+                "word_count": 1850,
+                "published_date": "2026-02-09T12:00:00"
+            },
+            "content": {
+                "html_body": "<h1>How AI Transforms Customer Service</h1><p>Introduction...</p>",
+                "markdown_body": "# How AI Transforms Customer Service\n\nIntroduction..."
+            },
+            "sources": [
+                "https://example.com/ai-trends-2026",
+                "https://research.com/customer-service-study"
+            ],
+            "quality_checks": {
+                "ai_isms_removed": True,
+                "citations_count": 12,
+                "readability_score": "good",
+                "seo_compliance": "passed",
+                "human_sounding": True
+            },
+            "editor_notes": "Excellent article with strong citations"
+        }
+    })
+
+
+class EditorOutput(BaseModel):
+    """
+    Lenient model of the editor agent's JSON output.
+    
+    Used by the crew to normalize whatever the editor produced; the strict
+    API models above validate the final response.
+    """
+    
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+    content: Dict[str, Any] = Field(default_factory=dict)
+    sources: List[Any] = Field(default_factory=list)
+    quality_checks: Optional[Dict[str, Any]] = None
+    editor_notes: Optional[str] = None
 
 
 class ExecutionMetadataResponse(BaseModel):
@@ -144,33 +214,55 @@ class ExecutionMetadataResponse(BaseModel):
     
     execution_time_seconds: float = Field(
         ...,
-        description="Total execution time in seconds",
-        example=45.2
+        description="Total execution time in seconds"
     )
     
     topic: str = Field(
         ...,
-        description="Original topic requested",
-        example="The Future of AI in Healthcare"
+        description="Original topic requested"
     )
     
     target_audience: Optional[str] = Field(
         None,
-        description="Target audience specification",
-        example="Healthcare professionals"
+        description="Target audience specification"
     )
     
     tone: str = Field(
         ...,
-        description="Writing tone used",
-        example="professional"
+        description="Writing tone used"
     )
     
     timestamp: str = Field(
         ...,
-        description="Generation timestamp",
-        example="2026-02-09 12:30:45"
+        description="Generation timestamp"
     )
+    
+    stage_timings: Optional[Dict[str, float]] = Field(
+        None,
+        description="Seconds spent in each pipeline stage"
+    )
+    
+    cache_hit: bool = Field(
+        False,
+        description="Whether the article was served from the result cache"
+    )
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "execution_time_seconds": 45.2,
+            "topic": "The Future of AI in Healthcare",
+            "target_audience": "Healthcare professionals",
+            "tone": "professional",
+            "timestamp": "2026-02-09 12:30:45",
+            "stage_timings": {
+                "research": 21.4,
+                "strategy": 9.8,
+                "writing": 10.6,
+                "editing": 3.4
+            },
+            "cache_hit": False
+        }
+    })
 
 
 class ContentGenerationSuccessResponse(BaseModel):
@@ -182,8 +274,7 @@ class ContentGenerationSuccessResponse(BaseModel):
     
     status: str = Field(
         default="success",
-        description="Response status",
-        example="success"
+        description="Response status"
     )
     
     data: ContentDataResponse = Field(
@@ -196,45 +287,43 @@ class ContentGenerationSuccessResponse(BaseModel):
         description="Execution metadata and timing information"
     )
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "status": "success",
-                "data": {
-                    "metadata": {
-                        "seo_title": "How AI Transforms Customer Service: Complete Guide",
-                        "meta_description": "Discover how AI revolutionizes customer service. Learn strategies, ROI metrics, and best practices.",
-                        "slug": "ai-customer-service-guide",
-                        "focus_keyword": "AI customer service",
-                        "estimated_read_time": "8 mins",
-                        "word_count": 1850,
-                        "published_date": "2026-02-09T12:00:00"
-                    },
-                    "content": {
-                        "html_body": "<h1>Title</h1><p>Content...</p>",
-                        "markdown_body": "# Title\n\nContent..."
-                    },
-                    "sources": [
-                        "https://example.com/source1",
-                        "https://example.com/source2"
-                    ],
-                    "quality_checks": {
-                        "ai_isms_removed": True,
-                        "citations_count": 12,
-                        "readability_score": "good",
-                        "seo_compliance": "passed",
-                        "human_sounding": True
-                    }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "status": "success",
+            "data": {
+                "metadata": {
+                    "seo_title": "How AI Transforms Customer Service: Complete Guide",
+                    "meta_description": "Discover how AI revolutionizes customer service. Learn strategies, ROI metrics, and best practices.",
+                    "slug": "ai-customer-service-guide",
+                    "focus_keyword": "AI customer service",
+                    "estimated_read_time": "8 mins",
+                    "word_count": 1850,
+                    "published_date": "2026-02-09T12:00:00"
                 },
-                "execution_metadata": {
-                    "execution_time_seconds": 45.2,
-                    "topic": "AI in Customer Service",
-                    "tone": "professional",
-                    "timestamp": "2026-02-09 12:30:45"
+                "content": {
+                    "html_body": "<h1>Title</h1><p>Content...</p>",
+                    "markdown_body": "# Title\n\nContent..."
+                },
+                "sources": [
+                    "https://example.com/source1",
+                    "https://example.com/source2"
+                ],
+                "quality_checks": {
+                    "ai_isms_removed": True,
+                    "citations_count": 12,
+                    "readability_score": "good",
+                    "seo_compliance": "passed",
+                    "human_sounding": True
                 }
+            },
+            "execution_metadata": {
+                "execution_time_seconds": 45.2,
+                "topic": "AI in Customer Service",
+                "tone": "professional",
+                "timestamp": "2026-02-09 12:30:45"
             }
         }
+    })
 
 
 class ErrorDetail(BaseModel):
@@ -242,15 +331,20 @@ class ErrorDetail(BaseModel):
     
     error_type: Optional[str] = Field(
         None,
-        description="Type of error that occurred",
-        example="ValidationError"
+        description="Type of error that occurred"
     )
     
     error_message: str = Field(
         ...,
-        description="Detailed error message",
-        example="Topic field is required and must be between 5-200 characters"
+        description="Detailed error message"
     )
+    
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "error_type": "ValidationError",
+            "error_message": "Topic field is required and must be between 5-200 characters"
+        }
+    })
 
 
 class ContentGenerationErrorResponse(BaseModel):
@@ -262,14 +356,12 @@ class ContentGenerationErrorResponse(BaseModel):
     
     status: str = Field(
         default="error",
-        description="Response status",
-        example="error"
+        description="Response status"
     )
     
     message: str = Field(
         ...,
-        description="Error message",
-        example="Content generation failed"
+        description="Error message"
     )
     
     detail: Optional[ErrorDetail] = Field(
@@ -282,20 +374,18 @@ class ContentGenerationErrorResponse(BaseModel):
         description="Execution metadata if available"
     )
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "status": "error",
-                "message": "Content generation failed",
-                "detail": {
-                    "error_type": "APIError",
-                    "error_message": "Serper API key is invalid"
-                },
-                "execution_metadata": {
-                    "execution_time_seconds": 5.3,
-                    "topic": "Test Topic",
-                    "timestamp": "2026-02-09 12:30:45"
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "status": "error",
+            "message": "Content generation failed",
+            "detail": {
+                "error_type": "APIError",
+                "error_message": "Serper API key is invalid"
+            },
+            "execution_metadata": {
+                "execution_time_seconds": 5.3,
+                "topic": "Test Topic",
+                "timestamp": "2026-02-09 12:30:45"
             }
         }
+    })
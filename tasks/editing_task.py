@@ -5,19 +5,17 @@ Task specification for the editor agent to perform quality assurance
 and generate final publication-ready output.
 """
 
-from crewai import Task
-from agents.editor import create_editor_agent
+from typing import TYPE_CHECKING
 
+# CrewAI and the agent factory load on first task creation, so reading
+# the prompt constants stays cheap
+if TYPE_CHECKING:
+    from crewai import Task
 
-def create_editing_task() -> Task:
-    """
-    Create an editorial review task for final content polish.
-    
-    Returns:
-        Configured Task instance
-    """
-    
-    description = """Review and finalize the draft article for publication. Your job is to 
+
+# Editing prompts are static apart from the delegation lines, which are
+# only rendered when the editor can delegate (see agents.editor)
+_EDITING_BRIEF = """Review and finalize the draft article for publication. Your job is to 
 ensure the content meets publication quality standards and generate all required metadata.
 
 EDITORIAL REVIEW CHECKLIST:
@@ -62,13 +60,7 @@ EDITORIAL REVIEW CHECKLIST:
    ✓ Keyword usage is natural, not forced
    ✓ No keyword stuffing
 
-6. MARKDOWN TO HTML CONVERSION
-   - Convert the Markdown article to clean HTML
-   - Preserve all hyperlinks and formatting
-   - Ensure valid HTML structure
-   - Keep both Markdown and HTML versions
-
-7. METADATA GENERATION
+6. METADATA GENERATION
    Create optimized metadata:
    
    - SEO Title: 55-60 characters, includes focus keyword, compelling
@@ -79,27 +71,40 @@ EDITORIAL REVIEW CHECKLIST:
    - Word Count: Total words in article
    - Source List: Extract all citation URLs
 
-8. QUALITY GATE DECISION
+7. QUALITY GATE DECISION
    
    IF content has major issues (poor quality, heavy AI-isms, missing citations):
-   → REJECT and delegate back to the writer with specific feedback
+   → {reject_step}
    
    IF content has minor issues (small formatting, slight rewording needed):
    → FIX THEM YOURSELF and proceed
    
    IF content meets all standards:
    → APPROVE and generate final JSON output
+{delegation_section}
+Your mission: Ensure every piece of content we publish is genuinely valuable,
+authentically human, and ready to rank."""
 
+_DELEGATION_SECTION = """
 DELEGATION AUTHORITY:
 You have the power to send the article back to the writer if quality is insufficient.
 Be ruthless but fair - our standards are high for a reason.
+"""
 
-Your mission: Ensure every piece of content we publish is genuinely valuable,
-authentically human, and ready to rank."""
-
-    expected_output = """Final publication-ready output in JSON format:
+# Keyed by whether the editor agent can delegate
+_EDITING_DESCRIPTIONS = {
+    True: _EDITING_BRIEF.format(
+        reject_step="REJECT and delegate back to the writer with specific feedback",
+        delegation_section=_DELEGATION_SECTION
+    ),
+    False: _EDITING_BRIEF.format(
+        reject_step="REJECT using the rejection format, with specific feedback for the writer",
+        delegation_section=""
+    )
+}
 
-{
+# The approved-article JSON; a fused writing task returns the same shape
+FINAL_OUTPUT_JSON = """{
   "status": "approved",
   "metadata": {
     "seo_title": "[55-60 char optimized title]",
@@ -111,7 +116,6 @@ authentically human, and ready to rank."""
     "published_date": "[current date in ISO format]"
   },
   "content": {
-    "html_body": "<h1>[Title]</h1><p>[Full HTML content]</p>...",
     "markdown_body": "# [Title]\\n\\n[Full Markdown content]..."
   },
   "sources": [
@@ -127,7 +131,11 @@ authentically human, and ready to rank."""
     "human_sounding": true
   },
   "editor_notes": "[Any important notes about the content or edits made]"
-}
+}"""
+
+_EDITING_EXPECTED_OUTPUT = """Final publication-ready output in JSON format:
+
+""" + FINAL_OUTPUT_JSON + """
 
 REJECTION FORMAT (if quality is insufficient):
 {
@@ -142,13 +150,25 @@ REJECTION FORMAT (if quality is insufficient):
 
 Ensure all fields are properly filled and the JSON is valid."""
 
+
+def create_editing_task() -> "Task":
+    """
+    Create an editorial review task for final content polish.
+    
+    Returns:
+        Configured Task instance
+    """
+    
+    from crewai import Task
+    from agents.editor import create_editor_agent, editor_can_delegate
+    
     # Create the editor agent
     agent = create_editor_agent()
     
     # Create and return the task
     task = Task(
-        description=description,
-        expected_output=expected_output,
+        description=_EDITING_DESCRIPTIONS[editor_can_delegate()],
+        expected_output=_EDITING_EXPECTED_OUTPUT,
         agent=agent
     )
     
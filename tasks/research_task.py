@@ -5,30 +5,18 @@ Task specification for the research agent to gather comprehensive
 information and identify content opportunities.
 """
 
-from crewai import Task
-from agents.researcher import create_research_agent
-from typing import Optional
+from string import Template
+from typing import TYPE_CHECKING, Optional
 
+# CrewAI and the agent factory load on first task creation, so reading
+# the prompt constants stays cheap
+if TYPE_CHECKING:
+    from crewai import Task
 
-def create_research_task(
-    topic: str,
-    target_audience: Optional[str] = None
-) -> Task:
-    """
-    Create a research task for analyzing a topic.
-    
-    Args:
-        topic: The blog topic to research
-        target_audience: Optional target audience specification
-        
-    Returns:
-        Configured Task instance
-    """
-    
-    # Build the description with optional audience targeting
-    audience_context = f" targeting {target_audience}" if target_audience else ""
-    
-    description = f"""Conduct comprehensive AI-focused research for a blog post on: "{topic}"{audience_context}
+
+# The brief names only the tools the researcher is given (see
+# agents.researcher.pick_tools), so it is rendered once per tool route
+_RESEARCH_BRIEF = """Conduct comprehensive AI-focused research for the blog post topic given at the end of this brief.
 
 Your research MUST include:
 
@@ -37,22 +25,22 @@ Your research MUST include:
    - What AI-specific questions are they trying to answer?
    - What AI problems are they trying to solve?
 
-2. CREDIBLE SOURCE RESEARCH (USE AI DOMAIN SEARCH TOOLS)
-   - Use ai_domain_search with categories: ["academic", "company_research", "government"]
+2. CREDIBLE SOURCE RESEARCH${source_heading}
+   - ${source_step}
    - Search academic sources (arXiv, NeurIPS, ACL, ICML) for technical foundations
    - Search company research blogs (OpenAI, DeepMind, Meta AI, Anthropic) for latest developments
    - Search government sources (AI.gov, NSF, NIH) for policy and funding insights
    - Prioritize sources from the last 6 months for AI topics
 
 3. COMPETITOR AI BLOG ANALYSIS
-   - Search for "{topic}" in AI blogs and analyze top 10 results
+   - Search for the topic in AI blogs and analyze top 10 results
    - What are they covering well about AI?
    - What AI-specific technical details are they missing? (CRITICAL - find the gaps!)
    - What format are they using? (tutorials, explainers, comparisons, benchmarks)
 
 4. DATA GATHERING & VERIFICATION (MANDATORY)
    - Find recent AI statistics (preferably from the last 6 months)
-   - Use verify_ai_claim to verify ALL major claims with 3+ credible sources
+   - ${verify_step}
    - Locate AI case studies or real-world applications
    - Identify expert AI opinions from authoritative sources
    - Record ALL source URLs for citations
@@ -74,10 +62,9 @@ Your research MUST include:
    - How can we provide more AI-specific value than what's already ranking?
 
 CRITICAL GUIDELINES FOR AI BLOG RESEARCH:
-- ALWAYS use ai_domain_search or multi_source_research for credible AI sources
-- NEVER use generic google_search for primary AI research
+${search_rules}
 - Prioritize academic sources (.edu, arxiv.org, research conferences, academic journals)
-- Verify ALL AI statistics and claims with verify_ai_claim (minimum 3 sources)
+- ${verify_rule}
 - Focus on actionable AI information, not just theory
 - Look for specific AI examples, benchmarks, and data points
 - Keep track of all URLs for proper citation
@@ -85,9 +72,41 @@ CRITICAL GUIDELINES FOR AI BLOG RESEARCH:
 - Include source credibility scores and categories in your findings
 
 Your research will form the foundation for an authoritative AI blog post.
-Be thorough, be specific, and find the unique AI angle that will make this content stand out."""
-
-    expected_output = """A comprehensive research brief in the following format:
+Be thorough, be specific, and find the unique AI angle that will make this content stand out.
+
+RESEARCH TOPIC: "${topic}"${audience_context}"""
+
+_AI_TOOL_GUIDANCE = {
+    "source_heading": " (USE AI DOMAIN SEARCH TOOLS)",
+    "source_step": 'Use ai_domain_search with categories: ["academic", "company_research", "government"]',
+    "verify_step": "Use verify_ai_claim to verify ALL major claims with 3+ credible sources",
+    "search_rules": (
+        "- ALWAYS use ai_domain_search or multi_source_research for credible AI sources\n"
+        "- NEVER use generic google_search for primary AI research"
+    ),
+    "verify_rule": "Verify ALL AI statistics and claims with verify_ai_claim (minimum 3 sources)"
+}
+
+_GENERAL_TOOL_GUIDANCE = {
+    "source_heading": "",
+    "source_step": "Use google_search with site: filters (e.g. site:arxiv.org) to reach credible sources",
+    "verify_step": "Cross-check ALL major claims against 3+ credible sources with google_search",
+    "search_rules": (
+        "- Use google_search with site: filters to favour credible AI sources\n"
+        "- Use scrape_website to read the strongest sources in full"
+    ),
+    "verify_rule": "Verify ALL AI statistics and claims against 3+ independent sources"
+}
+
+# Keyed by whether the researcher has the AI source tools. ${topic} and
+# ${audience_context} come last so the static brief is a shared prefix for
+# Gemini's implicit prompt caching.
+_RESEARCH_DESCRIPTIONS = {
+    True: Template(Template(_RESEARCH_BRIEF).safe_substitute(_AI_TOOL_GUIDANCE)),
+    False: Template(Template(_RESEARCH_BRIEF).safe_substitute(_GENERAL_TOOL_GUIDANCE))
+}
+
+_RESEARCH_EXPECTED_OUTPUT = """A comprehensive research brief in the following format:
 
 ## Research Brief: [Topic]
 
@@ -158,13 +177,42 @@ Total Sources: [Number]
 ### Recommended Angle
 [Your recommendation for the unique AI approach this blog post should take, backed by verified research]"""
 
-    # Create the research agent
-    agent = create_research_agent()
+
+def create_research_task(
+    topic: str,
+    target_audience: Optional[str] = None
+) -> "Task":
+    """
+    Create a research task for analyzing a topic.
+    
+    Args:
+        topic: The blog topic to research
+        target_audience: Optional target audience specification
+        
+    Returns:
+        Configured Task instance
+    """
+    
+    from crewai import Task
+    from agents.researcher import create_research_agent, is_ai_topic, uses_ai_source_tools
+    
+    # Build the description with optional audience targeting, describing
+    # the same tool set the agent gets
+    ai_topic = is_ai_topic(topic)
+    audience_context = f" targeting {target_audience}" if target_audience else ""
+    
+    description = _RESEARCH_DESCRIPTIONS[uses_ai_source_tools(ai_topic)].substitute(
+        topic=topic,
+        audience_context=audience_context
+    )
+    
+    # Create the research agent with tools routed by topic
+    agent = create_research_agent(ai_topic)
     
     # Create and return the task
     task = Task(
         description=description,
-        expected_output=expected_output,
+        expected_output=_RESEARCH_EXPECTED_OUTPUT,
         agent=agent
     )
     
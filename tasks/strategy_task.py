@@ -5,30 +5,19 @@ Task specification for the SEO strategist to create content outlines
 optimized for search rankings.
 """
 
-from crewai import Task
-from agents.strategist import create_seo_strategist
-from typing import Optional
+from string import Template
+from typing import TYPE_CHECKING, Optional
 
+# CrewAI and the agent factory load on first task creation, so reading
+# the prompt constants stays cheap
+if TYPE_CHECKING:
+    from crewai import Task
 
-def create_strategy_task(
-    topic: str,
-    tone: str = "professional"
-) -> Task:
-    """
-    Create an SEO strategy task for content planning.
-    
-    Args:
-        topic: The blog topic to strategize for
-        tone: Writing tone (professional, casual, technical, etc.)
-        
-    Returns:
-        Configured Task instance
-    """
-    
-    description = f"""Based on the research findings, create a comprehensive SEO-optimized 
-content outline for the topic: "{topic}"
 
-The tone should be: {tone}
+# Prompt text for every strategy task; only ${topic} and ${tone} vary, and
+# they come last so the rest is a shared prefix for prompt caching
+_STRATEGY_BRIEF = """${opening} create a comprehensive SEO-optimized 
+content outline for the topic given at the end of this brief, in the tone given there.
 
 Your strategy MUST include:
 
@@ -56,7 +45,7 @@ Your strategy MUST include:
    - Ensure concise, direct answers
 
 5. CONTENT LENGTH & DEPTH
-   - Recommended total word count (based on competitor analysis)
+   - Recommended total word count (${length_basis})
    - Word count per section
    - Topics that need deep coverage vs. brief mentions
 
@@ -80,9 +69,26 @@ STRATEGIC PRINCIPLES:
 - Balance comprehensiveness with readability
 - Optimize for both search engines and humans
 
-Create an outline that the writer can follow to produce ranking content."""
+Create an outline that the writer can follow to produce ranking content.
+
+TOPIC: "${topic}"
+The tone should be: ${tone}"""
+
+# Keyed by whether the research findings are in the task context. Run in
+# parallel with research, the strategist plans from the topic alone
+_STRATEGY_DESCRIPTIONS = {
+    True: Template(Template(_STRATEGY_BRIEF).safe_substitute(
+        opening="Based on the research findings,",
+        length_basis="based on competitor analysis"
+    )),
+    False: Template(Template(_STRATEGY_BRIEF).safe_substitute(
+        opening="Using your SEO expertise (no research findings are provided, so do not\n"
+                "cite statistics, sources or competitor pages),",
+        length_basis="based on what typically ranks for this kind of query"
+    ))
+}
 
-    expected_output = """A complete SEO strategy document in JSON format:
+_STRATEGY_EXPECTED_OUTPUT = """A complete SEO strategy document in JSON format:
 
 {
   "seo_strategy": {
@@ -155,13 +161,40 @@ Create an outline that the writer can follow to produce ranking content."""
 The outline should be detailed enough that the writer knows exactly what to write
 for each section."""
 
+
+def create_strategy_task(
+    topic: str,
+    tone: str = "professional",
+    research_context: bool = True
+) -> "Task":
+    """
+    Create an SEO strategy task for content planning.
+    
+    Args:
+        topic: The blog topic to strategize for
+        tone: Writing tone (professional, casual, technical, etc.)
+        research_context: Whether the task receives the research findings
+                          as context (False when it runs alongside research)
+        
+    Returns:
+        Configured Task instance
+    """
+    
+    description = _STRATEGY_DESCRIPTIONS[research_context].substitute(
+        topic=topic,
+        tone=tone
+    )
+    
+    from crewai import Task
+    from agents.strategist import create_seo_strategist
+    
     # Create the SEO strategist agent
     agent = create_seo_strategist()
     
     # Create and return the task
     task = Task(
         description=description,
-        expected_output=expected_output,
+        expected_output=_STRATEGY_EXPECTED_OUTPUT,
         agent=agent
     )
     
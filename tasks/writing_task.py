@@ -5,30 +5,17 @@ Task specification for the writer agent to create engaging,
 well-structured content.
 """
 
-from crewai import Task
-from agents.writer import create_writer_agent
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
+from tasks.editing_task import FINAL_OUTPUT_JSON
 
+# CrewAI and the agent factory load on first task creation, so reading
+# the prompt constants stays cheap
+if TYPE_CHECKING:
+    from crewai import Task
 
-def create_writing_task(
-    exclude_keywords: Optional[List[str]] = None
-) -> Task:
-    """
-    Create a writing task for content creation.
-    
-    Args:
-        exclude_keywords: Optional list of keywords/phrases to avoid
-        
-    Returns:
-        Configured Task instance
-    """
-    
-    # Build exclusion note if keywords provided
-    exclusion_note = ""
-    if exclude_keywords:
-        exclusion_note = f"\n\nIMPORTANT - DO NOT USE these words/phrases: {', '.join(exclude_keywords)}"
-    
-    description = f"""Using the research brief and SEO strategy outline, write a complete, 
+
+# The only per-call part of the writing prompt is {exclusion_note}
+_WRITING_DESCRIPTION = """Using the research brief and SEO strategy outline, write a complete, 
 engaging blog article in Markdown format.
 
 STRICT REQUIREMENTS:
@@ -103,7 +90,7 @@ ENGAGEMENT TACTICS:
 Your article should read like it was written by a knowledgeable human who genuinely
 wants to help the reader understand the topic."""
 
-    expected_output = """A complete blog article in Markdown format:
+_WRITING_EXPECTED_OUTPUT = """A complete blog article in Markdown format:
 
 # [H1 Title from Strategy]
 
@@ -164,13 +151,62 @@ REQUIREMENTS:
 - SEO: Focus keyword appears naturally 3-5 times
 - Quality: Every paragraph adds value, no fluff"""
 
+# With settings.fuse_writing_editing the writer also does the editor's job
+_FINALIZE_NOTE = """
+
+FINAL PASS - no separate editor will review this article:
+- Remove any AI-isms or corporate jargon before you finish
+- Check every claim has an inline citation and headings follow H1 > H2 > H3
+- Generate metadata: SEO title (55-60 chars, includes focus keyword), meta
+  description (150-160 chars, with CTA), URL slug, focus keyword, reading
+  time (200 WPM) and word count
+- List every cited URL in "sources"
+- Return the JSON below, with the full Markdown article in content.markdown_body"""
+
+_FINAL_EXPECTED_OUTPUT = """Final publication-ready output in JSON format:
+
+""" + FINAL_OUTPUT_JSON + """
+
+Ensure all fields are properly filled and the JSON is valid."""
+
+
+def create_writing_task(
+    exclude_keywords: Optional[List[str]] = None,
+    finalize: bool = False
+) -> "Task":
+    """
+    Create a writing task for content creation.
+    
+    Args:
+        exclude_keywords: Optional list of keywords/phrases to avoid
+        finalize: Also self-edit and return the final publication JSON,
+                  so the crew can skip the editing task
+        
+    Returns:
+        Configured Task instance
+    """
+    
+    # Build exclusion note if keywords provided
+    exclusion_note = ""
+    if exclude_keywords:
+        exclusion_note = f"\n\nIMPORTANT - DO NOT USE these words/phrases: {', '.join(exclude_keywords)}"
+    
+    description = _WRITING_DESCRIPTION.format(
+        exclusion_note=exclusion_note
+    )
+    if finalize:
+        description += _FINALIZE_NOTE
+    
+    from crewai import Task
+    from agents.writer import create_writer_agent
+    
     # Create the writer agent
     agent = create_writer_agent()
     
     # Create and return the task
     task = Task(
         description=description,
-        expected_output=expected_output,
+        expected_output=_FINAL_EXPECTED_OUTPUT if finalize else _WRITING_EXPECTED_OUTPUT,
         agent=agent
     )
     
@@ -8,14 +8,44 @@ This script tests the complete workflow:
 4. Editor reviews and finalizes
 """
 
+import asyncio
 import os
 import sys
-import json
 from datetime import datetime
+import orjson
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+async def stream_to_file(crew, markdown_file, **request):
+    """
+    Run the crew, writing the article body to disk as the editor produces it.
+    
+    Args:
+        crew: ContentGenerationCrew instance
+        markdown_file: Path the Markdown body is streamed to
+        **request: Arguments for generate_content_stream()
+        
+    Returns:
+        The final result dictionary (same shape as generate_content())
+    """
+    result = {}
+    streamed = False
+    with open(markdown_file, 'w', encoding='utf-8') as f:
+        async for event in crew.generate_content_stream(**request):
+            if event["event"] == "content":
+                f.write(event["data"])
+                streamed = True
+            elif event["event"] == "done":
+                result = event["data"]
+        
+        # Cached results arrive whole, with no content deltas
+        if not streamed:
+            f.write(result.get('data', {}).get('content', {}).get('markdown_body', ''))
+    
+    return result
+
+
 def main():
     print("\n" + "=" * 70)
     print("BLOG BRAIN - END-TO-END CONTENT GENERATION TEST")
@@ -67,17 +97,21 @@ def main():
     print("STARTING CONTENT GENERATION")
     print("=" * 70)
     print("\nThis may take 2-5 minutes as agents research, strategize, write, and edit...")
-    print("You'll see progress updates as each agent completes their work.\n")
+    print("You'll see progress updates as each agent completes their work.")
+    print("The article is written to test_output.md while the editor generates it.\n")
     
     start_time = datetime.now()
     
     try:
-        result = crew.generate_content(
+        markdown_file = "test_output.md"
+        result = asyncio.run(stream_to_file(
+            crew,
+            markdown_file,
             topic=test_topic,
             target_audience=test_audience,
             tone=test_tone,
             exclude_keywords=["game-changer", "revolutionary"]
-        )
+        ))
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -91,6 +125,15 @@ def main():
             print("✅ STATUS: SUCCESS")
             print(f"⏱️  Duration: {duration:.1f} seconds")
             
+            # Repeat runs with the same inputs are served from the result cache
+            cache_hit = result.get('execution_metadata', {}).get('cache_hit', False)
+            print(f"⚡ Result cache: {'HIT' if cache_hit else 'MISS'}")
+            
+            # Research and strategy overlap when PARALLEL_RESEARCH_STRATEGY is on
+            stage_timings = result.get('execution_metadata', {}).get('stage_timings') or {}
+            for stage, seconds in stage_timings.items():
+                print(f"  - {stage}: {seconds:.1f}s")
+            
             # Extract data
             data = result.get('data', {})
             metadata = data.get('metadata', {})
@@ -128,16 +171,16 @@ def main():
             print(f"  SEO Compliance: {quality_checks.get('seo_compliance', False)}")
             print(f"  Human Sounding: {quality_checks.get('human_sounding', False)}")
             
-            # Save full output
+            # Save the result; the article body is already in the .md file.
+            # Set DEBUG_JSON=1 for indented output.
             output_file = "test_output.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            print(f"\n💾 Full output saved to: {output_file}")
+            pretty = bool(os.getenv("DEBUG_JSON"))
+            saved = {**result, "data": {**data, "content": {**content, "markdown_body": None}}}
+            option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(saved, option=option))
+            print(f"\n💾 Result saved to: {output_file}")
             
-            # Save markdown
-            markdown_file = "test_output.md"
-            with open(markdown_file, 'w', encoding='utf-8') as f:
-                f.write(markdown)
             print(f"💾 Markdown saved to: {markdown_file}")
             
             print("\n" + "=" * 70)
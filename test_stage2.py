@@ -10,6 +10,9 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+FOUR_HUNDRED_WORDS = " ".join(["word"] * 400)
+
+
 def test_helpers():
     """Test utility functions"""
     from utils.helpers import (
@@ -33,10 +36,10 @@ def test_helpers():
     assert slug == "the-future-of-ai-in-healthcare-2026"
     
     # Test reading time
-    text = " ".join(["word"] * 400)  # 400 words
-    read_time = calculate_reading_time(text)
+    read_time = calculate_reading_time(FOUR_HUNDRED_WORDS)
     print(f"✓ Reading time for 400 words: {read_time}")
     assert "2 mins" in read_time
+    assert calculate_reading_time(word_count=400) == read_time
     
     # Test HTML sanitization
     dirty_html = '<p>Safe</p><script>alert("bad")</script><p>More safe</p>'
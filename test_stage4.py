@@ -35,7 +35,7 @@ def test_agent_imports():
     except ImportError as e:
         print(f"❌ Import error: {e}")
         print("   Make sure all dependencies are installed:")
-        print("   pip install crewai langchain-google-genai\n")
+        print("   pip install -r requirements.txt\n")
         return False
     except Exception as e:
         print(f"❌ Error: {e}\n")
@@ -114,7 +114,10 @@ def test_agent_configurations():
         print("\n✓ CrewAI settings:")
         print(f"  - Memory enabled: {settings.enable_memory}")
         print(f"  - Delegation enabled: {settings.enable_delegation}")
-        print(f"  - Max iterations: {settings.max_iterations}")
+        print(f"  - Max iterations (researcher): {settings.researcher_max_iter}")
+        print(f"  - Max iterations (strategist): {settings.strategist_max_iter}")
+        print(f"  - Max iterations (writer): {settings.writer_max_iter}")
+        print(f"  - Max iterations (editor): {settings.editor_max_iter}")
         
         print("\n✅ All configurations validated!\n")
         
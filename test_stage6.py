@@ -141,10 +141,13 @@ def test_crew_features():
         
         print("\n✓ Crew configuration:")
         print(f"  - Process: Sequential")
-        print(f"  - Verbose: True (detailed logs)")
+        print(f"  - Verbose: {settings.agent_verbose} (AGENT_VERBOSE)")
         print(f"  - Memory enabled: {settings.enable_memory}")
-        print(f"  - Max RPM: 30 (rate limiting)")
-        print(f"  - Max iterations: {settings.max_iterations}")
+        print(f"  - Max RPM: {settings.rpm_limit} (shared by all agents)")
+        print(f"  - Max iterations (researcher): {settings.researcher_max_iter}")
+        print(f"  - Max iterations (strategist): {settings.strategist_max_iter}")
+        print(f"  - Max iterations (writer): {settings.writer_max_iter}")
+        print(f"  - Max iterations (editor): {settings.editor_max_iter}")
         print()
         print("✓ Logging features:")
         print("  - Execution start/end markers")
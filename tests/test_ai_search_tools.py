@@ -66,6 +66,12 @@ class TestAICredibleSources:
         assert get_priority_for_domain('arxiv.org') == 1.0
         assert get_priority_for_domain('openai.com') == 0.8
         assert get_priority_for_domain('unknown.com') == 0.3
+    
+    def test_domain_lookup_normalizes_subdomains(self):
+        """Test subdomains and mixed case resolve to the listed domain."""
+        assert get_category_for_domain('www.arxiv.org') == 'academic'
+        assert get_category_for_domain('WWW.NSF.gov') == 'government'
+        assert get_priority_for_domain('WWW.ARXIV.ORG') == 1.0
 
 
 class TestExtractDomain:
@@ -2,6 +2,7 @@
 Unit tests for FastAPI endpoints.
 """
 
+import asyncio
 import pytest
 from fastapi.testclient import TestClient
 from main import app
@@ -36,6 +37,12 @@ class TestAPIEndpoints:
         assert data["status"] == "healthy"
         assert data["service"] == "Blog Brain API"
     
+    def test_elapsed_header(self, client):
+        """Test responses report server-side handling time."""
+        response = client.get("/health")
+        
+        assert float(response.headers["X-Elapsed-ms"]) >= 0
+    
     @patch('main.crew_instance.generate_content')
     def test_generate_post_success(self, mock_generate, client):
         """Test successful post generation."""
@@ -137,6 +144,42 @@ class TestAPIEndpoints:
         assert response.status_code == 500
         data = response.json()
         assert data["status"] == "error"
+    
+    @patch('main.crew_instance.generate_content')
+    def test_generate_post_generation_failure(self, mock_generate, client):
+        """Test a failed generation is reported as a 500 error body."""
+        mock_generate.return_value = {
+            "status": "error",
+            "message": "Content generation failed: quota exceeded"
+        }
+        
+        response = client.post(
+            "/api/v1/generate-post",
+            json={
+                "topic": "The Future of AI",
+                "tone": "professional"
+            }
+        )
+        
+        assert response.status_code == 500
+        data = response.json()
+        assert data["status"] == "error"
+        assert "quota exceeded" in data["message"]
+    
+    def test_generate_post_busy(self, client):
+        """Test requests beyond the generation slots get 429."""
+        with patch('main.generation_slots', asyncio.Semaphore(0)):
+            response = client.post(
+                "/api/v1/generate-post",
+                json={
+                    "topic": "The Future of AI",
+                    "tone": "professional"
+                }
+            )
+        
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
+        assert response.json()["status"] == "error"
 
 
 class TestCORSConfiguration:
@@ -0,0 +1,103 @@
+"""
+Unit tests for the result cache.
+"""
+
+import time
+import pytest
+from unittest.mock import patch
+from config import get_settings
+from utils import cache
+from utils.cache import cache_get, cache_put, canonical_topic, make_cache_key
+
+
+@pytest.fixture
+def cache_settings(tmp_path):
+    """Point the result cache at a fresh directory with a small LRU tier."""
+    settings = get_settings().model_copy(update={
+        "enable_result_cache": True,
+        "result_cache_dir": str(tmp_path / "results"),
+        "cache_ttl_hours": 1.0,
+        "memory_cache_size": 2
+    })
+    cache.get_result_cache.cache_clear()
+    cache._memory_tier.clear()
+    with patch('utils.cache.get_settings', return_value=settings):
+        yield settings
+    cache.get_result_cache().close()
+    cache.get_result_cache.cache_clear()
+    cache._memory_tier.clear()
+
+
+class TestCacheKeys:
+    """Tests for topic normalization and key building."""
+    
+    def test_canonical_topic(self):
+        """Test that case and whitespace differences normalize away."""
+        assert canonical_topic("  AI  in\tHealthcare ") == "ai in healthcare"
+        assert canonical_topic("AI in Healthcare") == canonical_topic("ai in healthcare")
+    
+    def test_key_ignores_argument_order(self):
+        """Test that the same inputs give the same key in any order."""
+        first = make_cache_key("research", topic="rag", target_audience=None)
+        second = make_cache_key("research", target_audience=None, topic="rag")
+        
+        assert first == second
+        assert first.startswith("research:")
+        assert len(first.split(":", 1)[1]) == 32
+    
+    def test_key_depends_on_inputs_and_namespace(self):
+        """Test that any changed input or namespace changes the key."""
+        key = make_cache_key("research", topic="rag", tone="casual")
+        
+        assert key != make_cache_key("research", topic="rag", tone="technical")
+        assert key != make_cache_key("strategy", topic="rag", tone="casual")
+
+
+class TestResultCache:
+    """Tests for the two-tier result cache."""
+    
+    def test_round_trip_through_disk(self, cache_settings):
+        """Test that a value read back from disk matches what was stored."""
+        article = {"status": "success", "data": {"title": "Café ☕", "word_count": 1200}}
+        cache_put("content:abc", article)
+        cache._memory_tier.clear()
+        
+        assert cache_get("content:abc") == article
+    
+    def test_disk_read_fills_memory_tier(self, cache_settings):
+        """Test that a disk hit is kept in the in-process tier."""
+        cache_put("research:abc", "brief")
+        cache._memory_tier.clear()
+        
+        cache_get("research:abc")
+        
+        assert "research:abc" in cache._memory_tier
+    
+    def test_memory_tier_evicts_least_recently_used(self, cache_settings):
+        """Test that the in-process tier keeps only its newest entries."""
+        cache_put("a", 1)
+        cache_put("b", 2)
+        cache_get("a")
+        cache_put("c", 3)
+        
+        assert list(cache._memory_tier) == ["a", "c"]
+        assert cache_get("b") == 2  # Still on disk
+    
+    def test_entries_expire(self, cache_settings):
+        """Test that neither tier serves a value past its TTL."""
+        cache_put("research:abc", "brief")
+        later = 2 * 3600
+        
+        with patch('time.monotonic', return_value=time.monotonic() + later), \
+             patch('time.time', return_value=time.time() + later):
+            assert cache_get("research:abc") is None
+        assert "research:abc" not in cache._memory_tier
+    
+    def test_disabled_cache(self, cache_settings):
+        """Test that nothing is stored or served when caching is off."""
+        disabled = cache_settings.model_copy(update={"enable_result_cache": False})
+        with patch('utils.cache.get_settings', return_value=disabled):
+            cache_put("research:abc", "brief")
+            
+            assert cache_get("research:abc") is None
+        assert not cache._memory_tier
@@ -0,0 +1,311 @@
+"""
+Unit tests for crew output parsing.
+"""
+
+import asyncio
+import threading
+import pytest
+from types import SimpleNamespace
+from crew import (
+    ContentGenerationCrew, _CrewEntry, _EditorStreamParser, _acquire_crew_lock,
+    _build_crew, _checkpoint_stages, _content_key, _private_llms, _restore_stages,
+    _stage_keys
+)
+from unittest.mock import patch
+
+
+APPROVED_OUTPUT = {
+    "status": "approved",
+    "metadata": {
+        "seo_title": "Edge AI for Retail: A Practical Guide",
+        "meta_description": "How retailers use edge AI today.",
+        "slug": "edge-ai-retail-guide",
+        "focus_keyword": "edge AI retail",
+        "estimated_read_time": "6 mins",
+        "word_count": 1200
+    },
+    "content": {
+        "markdown_body": "# Edge AI for Retail\n\nStores now run models on site."
+    },
+    "sources": ["https://example.com/edge-ai"]
+}
+
+
+@pytest.fixture
+def crew():
+    """Crew instance for parsing tests."""
+    return ContentGenerationCrew()
+
+
+class TestParseOutput:
+    """Tests for turning editor output into an API result."""
+    
+    def test_approved_output_is_success(self, crew):
+        """Test that complete editor output is validated and rendered."""
+        output = crew._parse_output(dict(APPROVED_OUTPUT))
+        
+        assert output["status"] == "success"
+        assert output["data"]["metadata"]["slug"] == "edge-ai-retail-guide"
+        assert "<h1>" in output["data"]["content"]["html_body"]
+        assert "status" not in output["data"]
+    
+    def test_rejected_output_is_error(self, crew):
+        """Test that an editor rejection is reported as an error."""
+        output = crew._parse_output({
+            "status": "rejected",
+            "reason": "Too few citations",
+            "required_changes": ["Cite the retail survey"],
+            "delegate_to": "writer"
+        })
+        
+        assert output["status"] == "error"
+        assert "Too few citations" in output["message"]
+        assert output["data"]["required_changes"] == ["Cite the retail survey"]
+    
+    def test_missing_fields_is_error(self, crew):
+        """Test that output without required fields is not a success."""
+        incomplete = dict(APPROVED_OUTPUT)
+        del incomplete["metadata"]
+        
+        output = crew._parse_output(incomplete)
+        
+        assert output["status"] == "error"
+        assert "metadata" in output["message"]
+
+
+def feed_all(chunks):
+    """Feed chunks to a fresh stream parser and collect its events."""
+    parser = _EditorStreamParser()
+    return [event for chunk in chunks for event in parser.feed(chunk)]
+
+
+def streamed_body(events):
+    """Join the markdown body deltas from parser events."""
+    return "".join(event["data"] for event in events if event["event"] == "content")
+
+
+class TestEditorStreamParser:
+    """Tests for incremental parsing of the streamed editor JSON."""
+    
+    def test_split_surrogate_pair(self):
+        """Test that an emoji escape split between its halves decodes whole."""
+        events = feed_all([
+            '{"content": {"markdown_body": "Launch \\uD83D',
+            '\\uDE00 day"}}'
+        ])
+        
+        assert streamed_body(events) == "Launch \U0001F600 day"
+        assert all(event["data"].encode("utf-8") for event in events)
+    
+    def test_split_escape(self):
+        """Test that a \\uXXXX escape cut mid-way is held for the next chunk."""
+        events = feed_all(['{"content": {"markdown_body": "caf\\u00', 'e9"}}'])
+        
+        assert streamed_body(events) == "caf\u00e9"
+    
+    def test_escaped_backslash_before_u(self):
+        """Test that a literal backslash followed by "u" is not held back."""
+        events = feed_all(['{"content": {"markdown_body": "C:\\\\u', 'sers"}}'])
+        
+        assert events[0]["data"] == "C:\\u"
+        assert streamed_body(events) == "C:\\users"
+    
+    def test_split_keys(self):
+        """Test that keys cut across chunks are still found."""
+        events = feed_all([
+            '{"metad',
+            'ata": {"slug": "edge-ai"}, "content": {"markdown_',
+            'body": "# Edge AI"}}'
+        ])
+        
+        assert events[0] == {"event": "metadata", "data": {"slug": "edge-ai"}}
+        assert streamed_body(events) == "# Edge AI"
+
+
+class TestGenerateContentStream:
+    """Tests for the streaming workflow."""
+    
+    @patch('crew._build_crew', side_effect=RuntimeError("crew failed"))
+    @patch('crew.cache_get', return_value=None)
+    def test_failure_ends_with_error_event(self, mock_cache_get, mock_build_crew, crew):
+        """Test that a failing run still ends the stream with a done event."""
+        async def collect():
+            return [event async for event in crew.generate_content_stream("Edge AI for Retail")]
+        
+        events = asyncio.run(collect())
+        
+        assert [event["event"] for event in events] == ["done"]
+        assert events[0]["data"]["status"] == "error"
+        assert events[0]["data"]["message"] == "crew failed"
+    
+    def test_cancelled_wait_releases_lock(self):
+        """Test that a client cancelled while waiting for the crew doesn't keep its lock."""
+        lock = threading.Lock()
+        lock.acquire()
+        
+        async def cancel_waiter():
+            waiter = asyncio.ensure_future(_acquire_crew_lock(lock))
+            await asyncio.sleep(0.05)
+            waiter.cancel()
+            lock.release()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0.05)
+        
+        asyncio.run(cancel_waiter())
+        
+        assert lock.acquire(timeout=1)
+    
+    def test_streaming_leaves_shared_llms_unchanged(self):
+        """Test that the stream flag a streaming run sets stays off the cached LLMs."""
+        entry = _build_crew("Edge AI for Retail", None, "professional", ())
+        shared_llms = [agent.llm for agent in entry.crew.agents]
+        flags = [llm.stream for llm in shared_llms]
+        
+        with _private_llms(entry.crew):
+            for agent in entry.crew.agents:
+                agent.llm.stream = not agent.llm.stream
+        
+        assert all(agent.llm is llm for agent, llm in zip(entry.crew.agents, shared_llms))
+        assert [llm.stream for llm in shared_llms] == flags
+
+
+def stage_tasks():
+    """Stand-in tasks by stage name, each left with a previous run's output."""
+    return {
+        name: SimpleNamespace(
+            description=f"{name} brief",
+            agent=SimpleNamespace(role=name.title()),
+            output=SimpleNamespace(raw=f"stale {name}")
+        )
+        for name in ("research", "strategy", "writing", "editing")
+    }
+
+
+STAGE_KEYS = {"research": "r-key", "strategy": "s-key", "writing": "w-key"}
+
+
+class TestStageCache:
+    """Tests for resuming runs from cached stage outputs."""
+    
+    def test_restore_sets_cached_outputs(self):
+        """Test that skipped stages get their cached output as a TaskOutput."""
+        stages = stage_tasks()
+        
+        _restore_stages(stages, {"research": "cached research"})
+        
+        assert stages["research"].output.raw == "cached research"
+        assert stages["research"].output.agent == "Research"
+    
+    def test_restore_clears_outputs_of_stages_to_run(self):
+        """Test that stages due to run start without a previous run's output."""
+        stages = stage_tasks()
+        
+        _restore_stages(stages, {"research": "cached research"})
+        
+        assert all(stages[name].output is None for name in ("strategy", "writing", "editing"))
+    
+    @patch('crew.cache_put')
+    def test_failed_run_checkpoints_only_finished_stages(self, mock_cache_put):
+        """Test that a reused crew doesn't checkpoint outputs from an earlier run."""
+        stages = stage_tasks()
+        cached_stages = {"research": "cached research"}
+        
+        _restore_stages(stages, cached_stages)
+        # This run finishes strategy, then fails while writing
+        stages["strategy"].output = SimpleNamespace(raw="fresh strategy")
+        _checkpoint_stages(stages, STAGE_KEYS, cached_stages)
+        
+        mock_cache_put.assert_called_once_with("s-key", "fresh strategy")
+    
+    @patch('crew.cache_put')
+    def test_skipped_stages_are_not_checkpointed(self, mock_cache_put):
+        """Test that a stage served from the cache isn't written back."""
+        stages = stage_tasks()
+        cached_stages = {"research": "cached research", "strategy": "cached strategy"}
+        
+        _restore_stages(stages, cached_stages)
+        _checkpoint_stages(stages, STAGE_KEYS, cached_stages)
+        
+        mock_cache_put.assert_not_called()
+
+
+class TestCacheKeys:
+    """Tests for the result cache keys of a request."""
+    
+    @pytest.mark.parametrize("setting", ["enable_domain_filtering", "fuse_writing_editing"])
+    def test_content_key_follows_workflow_settings(self, setting):
+        """Test that an article cached under one workflow isn't served under another."""
+        from config import get_settings
+        
+        settings = get_settings()
+        key = _content_key("Edge AI for Retail", None, "professional", None)
+        flipped = settings.model_copy(update={setting: not getattr(settings, setting)})
+        with patch('crew.settings', flipped):
+            assert _content_key("Edge AI for Retail", None, "professional", None) != key
+    
+    def test_research_key_follows_domain_filtering(self):
+        """Test that research gathered with AI source filtering is kept apart."""
+        from config import get_settings
+        
+        settings = get_settings()
+        key = _stage_keys("Edge AI for Retail", None, "professional", None)["research"]
+        flipped = settings.model_copy(
+            update={"enable_domain_filtering": not settings.enable_domain_filtering}
+        )
+        with patch('crew.settings', flipped):
+            assert _stage_keys("Edge AI for Retail", None, "professional", None)["research"] != key
+
+
+class TestClearMemory:
+    """Tests for per-scope memory cleanup."""
+    
+    def test_other_scopes_survive(self, crew, tmp_path):
+        """Test that clearing one scope keeps another scope's memories."""
+        from crewai.memory.storage.lancedb_storage import LanceDBStorage
+        from crewai.memory.types import MemoryRecord
+        from crewai.memory.unified_memory import Memory
+        
+        # Scoped crews share the default backing store
+        storage = LanceDBStorage(path=str(tmp_path))
+        for scope in ("tenant-a", "tenant-b"):
+            memory = Memory(storage=storage, root_scope=f"/crew/blog-brain-{scope}")
+            crew._scoped_crews[scope] = _CrewEntry(
+                SimpleNamespace(_memory=memory), {}, threading.Lock()
+            )
+        storage.save([
+            MemoryRecord(content="a fact", scope="/crew/blog-brain-tenant-a", embedding=[0.1] * 8),
+            MemoryRecord(content="b fact", scope="/crew/blog-brain-tenant-b", embedding=[0.2] * 8)
+        ])
+        
+        assert crew.clear_memory("tenant-a") is True
+        
+        assert storage.count("/crew/blog-brain-tenant-a") == 0
+        assert storage.count("/crew/blog-brain-tenant-b") == 1
+    
+    def test_unknown_scope(self, crew):
+        """Test that an unused scope is reported as not cleared."""
+        assert crew.clear_memory("tenant-x") is False
+
+
+
+class TestBuildCrew:
+    """Tests for crew assembly."""
+    
+    def test_agents_share_rpm_controller(self):
+        """Test that every crew's agents draw from the process-wide limiter."""
+        from agents._llm import get_rpm_controller
+        
+        first = _build_crew("Edge AI for Retail", None, "professional", ())
+        second = _build_crew("RAG for Support Teams", None, "casual", ())
+        
+        agents = first.crew.agents + second.crew.agents
+        assert all(agent._rpm_controller is get_rpm_controller() for agent in agents)
+    
+    def test_crew_verbosity_follows_settings(self):
+        """Test that crew console output is off unless AGENT_VERBOSE is set."""
+        from config import get_settings
+        
+        entry = _build_crew("Edge AI for Retail", None, "professional", ())
+        
+        assert entry.crew.verbose is get_settings().agent_verbose
@@ -0,0 +1,50 @@
+"""
+Unit tests for the shared agent LLM configuration.
+"""
+
+from agents._llm import create_llm, get_gemini_client
+
+
+class TestCreateLLM:
+    """Tests for the per-agent Gemini LLM."""
+    
+    def test_thinking_budget_is_applied(self):
+        """Test that the budget reaches the provider's thinking_config."""
+        llm = create_llm(0.4, 512, "gemini-2.5-flash")
+        
+        assert llm.thinking_config.thinking_budget == 512
+    
+    def test_zero_budget_disables_thinking(self):
+        """Test that a budget of 0 is sent as-is rather than enabling thinking."""
+        llm = create_llm(0.3, 0, "gemini-2.5-flash")
+        
+        assert llm.thinking_config.thinking_budget == 0
+        assert not llm.thinking_config.include_thoughts
+    
+    def test_no_budget_keeps_model_default(self):
+        """Test that None leaves the provider's default thinking_config."""
+        llm = create_llm(0.7, None, "gemini-2.5-flash")
+        
+        assert llm.thinking_config.thinking_budget is None
+    
+    def test_llms_share_one_client(self):
+        """Test that LLMs with different settings reuse the same Gemini client."""
+        writer = create_llm(0.7, None, "gemini-2.5-flash")
+        editor = create_llm(0.3, 0, "gemini-2.5-pro")
+        
+        assert writer._client is get_gemini_client()
+        assert editor._client is get_gemini_client()
+
+
+class TestRPMController:
+    """Tests for the process-wide request limiter."""
+    
+    def test_controller_is_shared(self):
+        """Test that every caller gets the same limiter with the configured budget."""
+        from agents._llm import get_rpm_controller
+        from config import get_settings
+        
+        controller = get_rpm_controller()
+        
+        assert controller is get_rpm_controller()
+        assert controller.max_rpm == get_settings().rpm_limit
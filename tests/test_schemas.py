@@ -92,6 +92,15 @@ class TestRequestSchema:
         assert "test" in request.exclude_keywords
         assert "word" in request.exclude_keywords
     
+    def test_exclude_keywords_keep_order(self):
+        """Test exclude keywords keep first-seen order after cleanup."""
+        request = ContentGenerationRequest(
+            topic="Test Topic",
+            exclude_keywords=[" zeta ", "alpha", "", "zeta", "mid"]
+        )
+        
+        assert request.exclude_keywords == ["zeta", "alpha", "mid"]
+    
     def test_exclude_keywords_max_limit(self):
         """Test exclude keywords max limit."""
         with pytest.raises(ValidationError):
@@ -0,0 +1,90 @@
+"""
+Unit tests for task prompt rendering.
+"""
+
+from unittest.mock import patch, MagicMock
+from tasks.strategy_task import create_strategy_task
+from tasks.research_task import create_research_task
+from tasks.editing_task import create_editing_task
+
+
+class TestTaskPrompts:
+    """Tests that the per-request values reach the rendered task descriptions."""
+    
+    @patch('agents.strategist.create_seo_strategist', MagicMock())
+    @patch('crewai.Task')
+    def test_strategy_description_has_topic_and_tone(self, mock_task):
+        """Test that the strategy description names the topic and tone."""
+        create_strategy_task("Edge AI for Retail", tone="casual")
+        
+        description = mock_task.call_args.kwargs["description"]
+        expected_output = mock_task.call_args.kwargs["expected_output"]
+        assert 'TOPIC: "Edge AI for Retail"' in description
+        assert "The tone should be: casual" in description
+        assert "${" not in expected_output
+    
+    @patch('agents.strategist.create_seo_strategist', MagicMock())
+    @patch('crewai.Task')
+    def test_strategy_description_without_research(self, mock_task):
+        """Test that a strategy run alongside research doesn't ask for its findings."""
+        create_strategy_task("Edge AI for Retail", research_context=False)
+        
+        description = mock_task.call_args.kwargs["description"]
+        assert "research findings" in description
+        assert "Based on the research findings" not in description
+        assert "competitor analysis" not in description
+        assert "${" not in description
+    
+    @patch('agents.strategist.create_seo_strategist', MagicMock())
+    @patch('crewai.Task')
+    def test_strategy_description_with_research(self, mock_task):
+        """Test that a sequential strategy is told to build on the research."""
+        create_strategy_task("Edge AI for Retail")
+        
+        description = mock_task.call_args.kwargs["description"]
+        assert description.startswith("Based on the research findings,")
+    
+    @patch('agents.researcher.is_ai_topic', MagicMock(return_value=True))
+    @patch('agents.researcher.create_research_agent', MagicMock())
+    @patch('crewai.Task')
+    def test_research_description_has_topic_and_audience(self, mock_task):
+        """Test that the research description names the topic and audience."""
+        create_research_task("Edge AI for Retail", target_audience="store managers")
+        
+        description = mock_task.call_args.kwargs["description"]
+        expected_output = mock_task.call_args.kwargs["expected_output"]
+        assert 'RESEARCH TOPIC: "Edge AI for Retail" targeting store managers' in description
+        assert "${" not in expected_output
+    
+    @patch('agents.researcher.is_ai_topic', MagicMock(return_value=False))
+    @patch('agents.researcher.create_research_agent', MagicMock())
+    @patch('crewai.Task')
+    def test_research_description_matches_general_tools(self, mock_task):
+        """Test that a non-AI topic's brief only names the general search tools."""
+        create_research_task("Small Business Bookkeeping")
+        
+        description = mock_task.call_args.kwargs["description"]
+        assert "google_search" in description
+        assert "ai_domain_search" not in description
+        assert "verify_ai_claim" not in description
+    
+    @patch('agents.editor.create_editor_agent', MagicMock())
+    @patch('crewai.Task')
+    def test_editing_description_without_delegation(self, mock_task):
+        """Test that the editing brief leaves delegation out when it is disabled."""
+        with patch('agents.editor.editor_can_delegate', return_value=False):
+            create_editing_task()
+        
+        description = mock_task.call_args.kwargs["description"]
+        assert "DELEGATION AUTHORITY" not in description
+        assert "delegate" not in description
+    
+    @patch('agents.editor.create_editor_agent', MagicMock())
+    @patch('crewai.Task')
+    def test_editing_description_with_delegation(self, mock_task):
+        """Test that the editing brief grants delegation when the editor has it."""
+        with patch('agents.editor.editor_can_delegate', return_value=True):
+            create_editing_task()
+        
+        description = mock_task.call_args.kwargs["description"]
+        assert "DELEGATION AUTHORITY" in description
@@ -4,7 +4,7 @@ Unit tests for Blog Brain tools (search and scraper).
 
 import pytest
 from tools.search_tools import google_search, news_search
-from tools.scraper_tools import scrape_website
+from tools.scraper_tools import scrape_website, scrape_multiple_websites
 from unittest.mock import patch, MagicMock
 
 
@@ -16,7 +16,7 @@ class TestSearchTools:
         assert google_search is not None
         assert news_search is not None
     
-    @patch('tools.search_tools.requests.post')
+    @patch('requests.Session.post')
     def test_google_search_success(self, mock_post, setup_environment):
         """Test successful Google search."""
         # Mock API response
@@ -42,7 +42,7 @@ class TestSearchTools:
         assert results[0]["title"] == "Test Article"
         assert results[0]["link"] == "https://test.com"
     
-    @patch('tools.search_tools.requests.post')
+    @patch('requests.Session.post')
     def test_news_search_success(self, mock_post, setup_environment):
         """Test successful news search."""
         # Mock API response
@@ -69,7 +69,7 @@ class TestSearchTools:
         assert results[0]["title"] == "Breaking News"
         assert results[0]["source"] == "NewsSource"
     
-    @patch('tools.search_tools.requests.post')
+    @patch('requests.Session.post')
     def test_search_error_handling(self, mock_post):
         """Test search error handling."""
         # Mock API error
@@ -89,7 +89,7 @@ class TestScraperTools:
         """Test that scraper tools can be imported."""
         assert scrape_website is not None
     
-    @patch('tools.scraper_tools.requests.get')
+    @patch('requests.Session.get')
     def test_scrape_website_success(self, mock_get):
         """Test successful website scraping."""
         # Mock HTML response
@@ -118,7 +118,7 @@ class TestScraperTools:
         assert "Test Title" in result["title"]
         assert result["word_count"] > 0
     
-    @patch('tools.scraper_tools.requests.get')
+    @patch('requests.Session.get')
     def test_scrape_timeout_handling(self, mock_get):
         """Test timeout error handling."""
         from requests.exceptions import Timeout
@@ -133,7 +133,7 @@ class TestScraperTools:
         assert result["success"] is False
         assert "error" in result
     
-    @patch('tools.scraper_tools.requests.get')
+    @patch('requests.Session.get')
     def test_scrape_content_truncation(self, mock_get):
         """Test content truncation to max_content_length."""
         # Mock large HTML response
@@ -149,6 +149,51 @@ class TestScraperTools:
         # Verify content was truncated
         assert result["success"] is True
         assert len(result["content"]) <= 100
+    
+    @patch('requests.Session.get')
+    def test_scrape_multiple_keeps_input_order(self, mock_get):
+        """Test batch scraping returns one result per URL in input order."""
+        def fake_get(url, **kwargs):
+            mock_response = MagicMock()
+            mock_response.content = f"<html><body><h1>{url}</h1><p>Text</p></body></html>".encode()
+            mock_response.raise_for_status = MagicMock()
+            return mock_response
+        
+        mock_get.side_effect = fake_get
+        urls = ["https://a.com/1", "https://b.com/1", "https://a.com/2"]
+        
+        results = scrape_multiple_websites.func(urls, delay=0)
+        
+        assert [r["title"] for r in results] == urls
+        assert all(r["success"] for r in results)
+
+
+class TestLinkChecker:
+    """Test cases for source link verification."""
+    
+    @patch('requests.Session.head')
+    def test_check_urls_statuses(self, mock_head):
+        """Test duplicate URLs are checked once and errors map to None."""
+        from requests.exceptions import ConnectionError
+        from utils.http import check_urls
+        
+        def fake_head(url, **kwargs):
+            if "down" in url:
+                raise ConnectionError("unreachable")
+            return MagicMock(status_code=404 if "missing" in url else 200)
+        
+        mock_head.side_effect = fake_head
+        
+        statuses = check_urls(
+            ["https://ok.com", "https://ok.com", "https://missing.com", "https://down.com"]
+        )
+        
+        assert statuses == {
+            "https://ok.com": 200,
+            "https://missing.com": 404,
+            "https://down.com": None
+        }
+        assert mock_head.call_count == 3
 
 
 if __name__ == "__main__":
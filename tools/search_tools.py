@@ -15,6 +15,7 @@ from research_config.ai_credible_sources import (  # ai_credible_sources is in r
     get_category_for_domain,
     get_priority_for_domain,
 )
+from utils.http import get_http_session
 from utils.logger import setup_logger
 from typing import Dict, List, Any, Optional
 from urllib.parse import urlparse
@@ -59,7 +60,7 @@ def google_search(query: str, num_results: int = 10) -> List[Dict[str, Any]]:
     try:
         logger.info(f"Searching Google for: '{query}' (requesting {num_results} results)")
         
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = get_http_session().post(url, json=payload, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -122,7 +123,7 @@ def news_search(query: str, num_results: int = 5) -> List[Dict[str, Any]]:
     try:
         logger.info(f"Searching news for: '{query}'")
         
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = get_http_session().post(url, json=payload, headers=headers, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -0,0 +1,149 @@
+"""
+Result cache for Blog Brain.
+
+Stores finished articles and reusable stage outputs on disk so identical
+requests (retries, re-renders, tone variants of one topic) skip agent runs.
+Recently used entries are also kept in a small in-process LRU in front of
+the disk cache.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+from config import get_settings
+
+# In-process tier: key -> (expires_at, value), most recently used last
+_memory_tier: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+# zlib level for cached values; 6 is near the size floor for JSON text
+# at a fraction of level 9's CPU cost
+_COMPRESS_LEVEL = 6
+
+
+def canonical_topic(topic: str) -> str:
+    """
+    Normalize a topic for cache lookups.
+
+    Case and whitespace differences don't change what gets written, so
+    "AI  in Healthcare" and "ai in healthcare" share cache entries.
+
+    Args:
+        topic: Topic as requested
+
+    Returns:
+        Lower-cased topic with whitespace collapsed
+
+    Example:
+        >>> canonical_topic("  AI  in Healthcare ")
+        'ai in healthcare'
+    """
+    return " ".join(topic.lower().split())
+
+
+def make_cache_key(namespace: str, **inputs: Any) -> str:
+    """
+    Build a stable cache key from request inputs.
+
+    Args:
+        namespace: Kind of cached value (e.g. "content", "research")
+        **inputs: JSON-serializable inputs the cached value depends on
+
+    Returns:
+        Namespaced 32-character hex digest
+
+    Example:
+        >>> make_cache_key("research", topic="RAG", target_audience=None)
+        'research:...'
+    """
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+@lru_cache(maxsize=1)
+def get_result_cache():
+    """
+    Get the process-wide on-disk result cache.
+
+    Values are stored as zlib-compressed JSON. Articles and research
+    briefs are mostly prose and shrink several times over, which keeps
+    the SQLite file small and cold reads fast. Every cached value is
+    JSON-serializable (stage outputs are strings, articles are parsed
+    editor JSON).
+
+    Returns:
+        diskcache.Cache backed by settings.result_cache_dir
+    """
+    from diskcache import Cache, JSONDisk
+
+    return Cache(
+        get_settings().result_cache_dir,
+        disk=JSONDisk,
+        disk_compress_level=_COMPRESS_LEVEL
+    )
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """
+    Look up a cached value, checking the in-process tier first.
+
+    Args:
+        key: Key from make_cache_key()
+
+    Returns:
+        The cached value, or None on a miss (or when caching is disabled)
+    """
+    settings = get_settings()
+    if not settings.enable_result_cache:
+        return None
+
+    now = time.monotonic()
+    with _memory_lock:
+        entry = _memory_tier.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                _memory_tier.move_to_end(key)
+                return entry[1]
+            del _memory_tier[key]
+
+    value = get_result_cache().get(key)
+    if value is not None:
+        _remember(key, value, settings.cache_ttl_hours * 3600)
+    return value
+
+
+def cache_put(key: str, value: Any) -> None:
+    """
+    Store a value for settings.cache_ttl_hours.
+
+    The in-process tier keeps the value itself, so callers must not
+    mutate it after storing it.
+
+    Args:
+        key: Key from make_cache_key()
+        value: JSON-serializable value to cache
+    """
+    settings = get_settings()
+    if not settings.enable_result_cache:
+        return
+    ttl = settings.cache_ttl_hours * 3600
+    get_result_cache().set(key, value, expire=ttl)
+    _remember(key, value, ttl)
+
+
+def _remember(key: str, value: Any, ttl: float) -> None:
+    """Store a value in the in-process tier, evicting the oldest entries."""
+    max_entries = get_settings().memory_cache_size
+    if max_entries <= 0:
+        return
+
+    with _memory_lock:
+        _memory_tier[key] = (time.monotonic() + ttl, value)
+        _memory_tier.move_to_end(key)
+        while len(_memory_tier) > max_entries:
+            _memory_tier.popitem(last=False)
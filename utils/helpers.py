@@ -5,9 +5,35 @@ Common functions used across the application.
 """
 
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
+# Phrases that make copy read as AI-written; the writer is told to avoid
+# them and the crew checks the final article for leftovers
+BANNED_PHRASES: Tuple[str, ...] = (
+    "unleash", "unlock", "delve", "dive deep", "landscape", "game-changer",
+    "cutting-edge", "revolutionary", "groundbreaking", "in today's world",
+    "in this day and age", "it's no secret", "needless to say",
+    "at the end of the day", "when all is said and done"
+)
 
+_SLUG_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_PATTERN = re.compile(r'[\s_-]+')
+_SCRIPT_TAG_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_IFRAME_TAG_PATTERN = re.compile(r'<iframe[^>]*>.*?</iframe>', re.DOTALL | re.IGNORECASE)
+_EVENT_HANDLER_PATTERN = re.compile(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', re.IGNORECASE)
+_URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['\u2019-][^\W\d_]+)*")
+# Sentence ends; line breaks count too, since headings and list items
+# usually end without punctuation
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]+|\n")
+
+# Upper Lix bound for each readability bucket (Lix < 40 reads as plain prose)
+LIX_BUCKETS: Tuple[Tuple[float, str], ...] = ((40.0, "good"), (50.0, "fair"))
+
+
+
+@lru_cache(maxsize=1024)
 def generate_slug(title: str) -> str:
     """
     Generate a URL-friendly slug from a title.
@@ -26,10 +52,10 @@ def generate_slug(title: str) -> str:
     slug = title.lower()
     
     # Remove any characters that aren't alphanumeric, spaces, or hyphens
-    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = _SLUG_STRIP_PATTERN.sub('', slug)
     
     # Replace spaces and underscores with hyphens
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    slug = _SLUG_SEPARATOR_PATTERN.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -37,13 +63,19 @@ def generate_slug(title: str) -> str:
     return slug
 
 
-def calculate_reading_time(text: str, words_per_minute: int = 200) -> str:
+def calculate_reading_time(
+    text: str = "",
+    words_per_minute: int = 200,
+    *,
+    word_count: Optional[int] = None
+) -> str:
     """
     Calculate estimated reading time for text content.
     
     Args:
         text: The text content to analyze
         words_per_minute: Average reading speed (default: 200 WPM)
+        word_count: Known word count; skips splitting the text
         
     Returns:
         Formatted reading time string (e.g., "5 mins")
@@ -51,9 +83,11 @@ def calculate_reading_time(text: str, words_per_minute: int = 200) -> str:
     Example:
         >>> calculate_reading_time("This is a short article...")
         '1 min'
+        >>> calculate_reading_time(word_count=1850)
+        '9 mins'
     """
     # Count words
-    words = len(text.split())
+    words = word_count if word_count is not None else len(text.split())
     
     # Calculate minutes (minimum 1 minute)
     minutes = max(1, round(words / words_per_minute))
@@ -62,6 +96,33 @@ def calculate_reading_time(text: str, words_per_minute: int = 200) -> str:
     return f"{minutes} min{'s' if minutes > 1 else ''}"
 
 
+@lru_cache(maxsize=1)
+def _get_markdown_renderer():
+    """Build the shared Markdown renderer (CommonMark plus tables and strikethrough)."""
+    from markdown_it import MarkdownIt
+
+    return MarkdownIt("commonmark", {"html": False}).enable(["table", "strikethrough"])
+
+
+def markdown_to_html(markdown: str) -> str:
+    """
+    Render article Markdown to HTML.
+    
+    Raw HTML in the Markdown is escaped rather than passed through.
+    
+    Args:
+        markdown: Article in Markdown format
+        
+    Returns:
+        HTML string
+        
+    Example:
+        >>> markdown_to_html("# Title\\n\\nSee [arXiv](https://arxiv.org).")
+        '<h1>Title</h1>\\n<p>See <a href="https://arxiv.org">arXiv</a>.</p>\\n'
+    """
+    return _get_markdown_renderer().render(markdown)
+
+
 def sanitize_html(html: str) -> str:
     """
     Basic HTML sanitization to remove potentially harmful content.
@@ -77,16 +138,16 @@ def sanitize_html(html: str) -> str:
         '<p>Safe content</p>'
     """
     # Remove script tags and their content
-    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _SCRIPT_TAG_PATTERN.sub('', html)
     
     # Remove iframe tags
-    html = re.sub(r'<iframe[^>]*>.*?</iframe>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = _IFRAME_TAG_PATTERN.sub('', html)
     
     # Remove style tags (optional - uncomment if needed)
     # html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
     
     # Remove onclick and other event handlers
-    html = re.sub(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', '', html, flags=re.IGNORECASE)
+    html = _EVENT_HANDLER_PATTERN.sub('', html)
     
     return html
 
@@ -152,12 +213,7 @@ def extract_urls(text: str) -> list[str]:
         >>> extract_urls("Check out https://example.com and http://test.com")
         ['https://example.com', 'http://test.com']
     """
-    # URL pattern
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    
-    urls = re.findall(url_pattern, text)
-    
-    return urls
+    return _URL_PATTERN.findall(text)
 
 
 def format_metadata(title: str, description: str) -> Dict[str, str]:
@@ -187,3 +243,111 @@ def format_metadata(title: str, description: str) -> Dict[str, str]:
         "title_length": len(formatted_title),
         "description_length": len(formatted_description)
     }
+
+
+@lru_cache(maxsize=128)
+def compile_phrase_pattern(phrases: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a phrase list into one case-insensitive, whole-word regex.
+    
+    Longer phrases are tried first and either apostrophe style matches,
+    so any number of phrases is found in a single pass over the text.
+    
+    Args:
+        phrases: Phrases to match (a tuple, so compiled patterns are cached)
+        
+    Returns:
+        Compiled alternation pattern
+    """
+    alternation = "|".join(
+        re.escape(phrase).replace("'", "['\u2019]")
+        for phrase in sorted(phrases, key=len, reverse=True)
+    )
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+
+def find_phrases(text: str, phrases: Tuple[str, ...]) -> List[Tuple[int, str]]:
+    """
+    Find occurrences of any of the given phrases in text.
+    
+    Args:
+        text: Text to scan
+        phrases: Phrases to look for
+        
+    Returns:
+        List of (offset, lower-cased match) tuples in order of appearance
+        
+    Example:
+        >>> find_phrases("Our Synergy plan", ("synergy",))
+        [(4, 'synergy')]
+    """
+    if not phrases:
+        return []
+    pattern = compile_phrase_pattern(phrases)
+    return [(m.start(), m.group(0).lower()) for m in pattern.finditer(text)]
+
+
+def find_ai_isms(text: str) -> List[Tuple[int, str]]:
+    """
+    Find banned AI-sounding phrases in text in a single pass.
+    
+    Args:
+        text: Article text (Markdown or HTML)
+        
+    Returns:
+        List of (offset, phrase) tuples in order of appearance
+        
+    Example:
+        >>> find_ai_isms("Let's delve into it. Needless to say, it works.")
+        [(6, 'delve'), (21, 'needless to say')]
+    """
+    return find_phrases(text, BANNED_PHRASES)
+
+
+def lix_score(text: str) -> float:
+    """
+    Compute the Lix readability index of a text.
+    
+    Lix = words per sentence + percentage of words longer than six letters.
+    It needs no syllable counting, so it is cheap enough to run on every
+    article. Below 30 is easy, 30-40 medium, 40-50 hard, above 50 very hard.
+    
+    Args:
+        text: Article text (Markdown or plain text)
+        
+    Returns:
+        Lix score (0.0 for text without words)
+        
+    Example:
+        >>> round(lix_score("The cat sat. Transformers generalize remarkably."), 1)
+        53.0
+    """
+    words = _WORD_PATTERN.findall(text)
+    if not words:
+        return 0.0
+    
+    sentences = sum(
+        1 for chunk in _SENTENCE_END_PATTERN.split(text) if _WORD_PATTERN.search(chunk)
+    )
+    long_words = sum(1 for word in words if len(word) > 6)
+    return len(words) / max(1, sentences) + 100 * long_words / len(words)
+
+
+def readability_bucket(score: float) -> str:
+    """
+    Map a Lix score to the "good"/"fair"/"poor" scale used in quality checks.
+    
+    Args:
+        score: Score from lix_score()
+        
+    Returns:
+        Readability bucket name
+        
+    Example:
+        >>> readability_bucket(35.0)
+        'good'
+    """
+    for upper, bucket in LIX_BUCKETS:
+        if score < upper:
+            return bucket
+    return "poor"
@@ -0,0 +1,115 @@
+"""
+Shared HTTP session for Blog Brain tools.
+
+Search and scraper tools run in crew worker threads and call the same few
+hosts (Serper, arXiv, lab blogs) over and over. One pooled session keeps
+those connections alive across tool calls and crew runs, so repeat
+requests skip the TCP/TLS handshake. Connection errors and transient
+statuses (429, 5xx) are retried with backoff by the session itself.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import get_settings
+
+# Servers that refuse HEAD but may serve GET
+_HEAD_UNSUPPORTED = {403, 405, 501}
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide pooled HTTP session.
+
+    Returns:
+        requests.Session with keep-alive connection pools per host
+
+    Example:
+        >>> response = get_http_session().get("https://arxiv.org", timeout=10)
+    """
+    settings = get_settings()
+    retry = Retry(
+        total=settings.http_retries,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,   # Serper searches are POSTs but idempotent
+        raise_on_status=False   # Hand back the last response; callers check it
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.http_pool_size,
+        pool_maxsize=settings.http_pool_size,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_io_pool() -> ThreadPoolExecutor:
+    """
+    Get the process-wide thread pool for blocking HTTP fan-out.
+
+    Sized to the connection pool, so concurrent requests never wait on a
+    connection. Reused across calls instead of spawning threads each time.
+
+    Returns:
+        ThreadPoolExecutor with settings.http_pool_size workers
+    """
+    return ThreadPoolExecutor(
+        max_workers=get_settings().http_pool_size,
+        thread_name_prefix="http-io"
+    )
+
+
+def _probe_url(url: str, timeout: float) -> Optional[int]:
+    """
+    Get the final HTTP status for a URL.
+
+    Args:
+        url: URL to probe
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        HTTP status code, or None if the URL could not be reached
+    """
+    session = get_http_session()
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        if response.status_code not in _HEAD_UNSUPPORTED:
+            return response.status_code
+        with session.get(url, allow_redirects=True, timeout=timeout, stream=True) as response:
+            return response.status_code
+    except requests.exceptions.RequestException:
+        return None
+
+
+def check_urls(urls: Iterable[str], timeout: float = 5.0) -> Dict[str, Optional[int]]:
+    """
+    Check many URLs concurrently over the shared session.
+
+    Duplicates are checked once; requests run on the shared I/O pool.
+
+    Args:
+        urls: URLs to check
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Dictionary mapping each URL to its HTTP status (None if unreachable)
+
+    Example:
+        >>> statuses = check_urls(["https://arxiv.org", "https://example.com/missing"])
+        >>> broken = [url for url, status in statuses.items() if not status or status >= 400]
+    """
+    unique = list(dict.fromkeys(urls))
+    if not unique:
+        return {}
+
+    statuses = get_io_pool().map(lambda url: _probe_url(url, timeout), unique)
+    return dict(zip(unique, statuses))